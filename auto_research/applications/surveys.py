@@ -1,21 +1,75 @@
 from __future__ import annotations
 
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import logging
 import os
-import traceback
+from typing import Optional
+from typing import Sequence
 
 from LLM_utils.inquiry import get_api_key
+from LLM_utils.inquiry import OpenAI_interface
 
 from auto_research.reimplementation.code_availability_check import base_prompt_formatted
 from auto_research.reimplementation.code_availability_check import test_github_link
 from auto_research.search.core import AutoSearch
 from auto_research.search.information import extract_score
+from auto_research.search.keywords import deduplicate_keywords
 from auto_research.search.keywords import suggest_keywords
 from auto_research.search.post_processing import ArticleOrganizer
 from auto_research.survey.core import AutoSurvey
+from auto_research.survey.core import AutoSurveyBatch
+from auto_research.survey.paper_reader import cache_paper_texts
+from auto_research.utils.cache import ResponseCache
 from auto_research.utils.files import get_all_pdf_files
 from auto_research.utils.files import print_summaries
 
 
+def _run_surveys(survey_instances: list[AutoSurvey], max_concurrency: int) -> float:
+    """
+    Run several AutoSurvey instances concurrently and return their total cost.
+
+    The PDF files are read lazily by the worker threads, where PyMuPDF (which is not thread-safe)
+    is only used under a lock; their text is usually cached beforehand by ``cache_paper_texts``.
+
+    Args:
+        survey_instances: The AutoSurvey instances to run.
+        max_concurrency: Maximum number of inquiries in flight at the same time.
+
+    Returns:
+        float: The accumulated cost of all instances.
+    """
+
+    def run_one(survey_instance: AutoSurvey) -> float:
+        survey_instance.run()
+        return survey_instance.cost_accumulation
+
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+        return sum(executor.map(run_one, survey_instances))
+
+
+def _select_by_ranks(items: list[str], ranks: Sequence[int]) -> list[str]:
+    """
+    Select items by their 1-based ranks.
+
+    Args:
+        items: The ranked items.
+        ranks: The ranks of the items to select.
+
+    Returns:
+        list[str]: The selected items, in the order of the given ranks.
+
+    Raises:
+        ValueError: If no rank is given or a rank is out of range.
+    """
+    if not ranks:
+        raise ValueError("No ranks were given.")
+    invalid_ranks = [rank for rank in ranks if not 1 <= rank <= len(items)]
+    if invalid_ranks:
+        raise ValueError(f"Ranks must be between 1 and {len(items)}, got {invalid_ranks}.")
+    return [items[rank - 1] for rank in ranks]
+
+
 def topic_to_survey(
     num_results: int = 30,
     sort_by: str = "relevance",
@@ -29,6 +83,15 @@ def topic_to_survey(
     order_by_score: bool = True,
     zip_folder: bool = True,
     api_key: str | None = None,  # New parameter for direct API key input
+    use_llm_cache: bool = True,
+    max_concurrency: int = 4,
+    topic: Optional[str] = None,
+    keyword_option: Optional[str] = None,
+    keyword_ranks: Optional[Sequence[int]] = None,
+    custom_keywords: Optional[Sequence[str]] = None,
+    summary_option: Optional[str] = None,
+    summary_ranks: Optional[Sequence[int]] = None,
+    check_code: Optional[bool] = None,
 ) -> None:
     """
     Conducts an automated research process based on the provided topic and settings.
@@ -47,14 +110,51 @@ def topic_to_survey(
         zip_folder: Whether to zip the organized folder. Defaults to True.
         api_key: Directly provide the API key as a string. If None, the key will be retrieved from
         the file. Defaults to None.
+        use_llm_cache: Whether to reuse LLM responses cached in
+        ``<destination_folder>/llm_cache.sqlite`` for identical prompts, e.g. when the same papers
+        are summarized again. Defaults to True.
+        max_concurrency: Maximum number of papers processed by the LLM at the same time when
+        summarizing and checking code availability. Defaults to 4.
+        topic: The research topic or question. If None, the user is asked for it. The same
+        applies to all following arguments, so that the process can run without any prompt when
+        they are all given. Defaults to None.
+        keyword_option: How to use the suggested keywords: "all", "select" (requires
+        ``keyword_ranks``) or "custom" (requires ``custom_keywords``). Defaults to None.
+        keyword_ranks: Ranks of the suggested keywords to use with the "select" option.
+        Defaults to None.
+        custom_keywords: Keywords to use with the "custom" option. Defaults to None.
+        summary_option: Which papers to summarize: "all" or "select" (requires
+        ``summary_ranks``). Defaults to None.
+        summary_ranks: Ranks of the papers to summarize with the "select" option. Defaults to
+        None.
+        check_code: Whether to check the code availability of the articles. Defaults to None.
+
+    Raises:
+        ValueError: If one of the non-interactive arguments is invalid.
 
     Example:
         >>> topic_to_survey(api_key="your_api_key_here")
+        >>> topic_to_survey(
+        ...     api_key="your_api_key_here",
+        ...     topic="Applications of AI in healthcare",
+        ...     keyword_option="all",
+        ...     summary_option="all",
+        ...     check_code=True,
+        ... )
     """
+    if keyword_option is not None and keyword_option not in ["all", "select", "custom"]:
+        raise ValueError(f"Invalid keyword option: {keyword_option!r}.")
+    if summary_option is not None and summary_option not in ["all", "select"]:
+        raise ValueError(f"Invalid summary option: {summary_option!r}.")
+
     # Get user input for the research topic
-    user_prompt = input(
-        "Please enter your research topic or question (e.g., 'Applications of AI in healthcare'): "
-    )
+    if topic is not None:
+        user_prompt = topic
+    else:
+        user_prompt = input(
+            "Please enter your research topic or question "
+            "(e.g., 'Applications of AI in healthcare'): "
+        )
 
     # Retrieve the API key
     key = api_key if api_key is not None else get_api_key(api_key_path, api_key_type)
@@ -67,21 +167,27 @@ def topic_to_survey(
         print(f"{i}. {keyword}")
 
     # Step 2: Ask the user for their preferred option with detailed explanations
-    print("\nHow would you like to proceed with the suggested keywords?")
-    print("1. 'all': Use all the suggested keywords for searching.")
-    print("2. 'select': Choose specific keywords by their ranks.")
-    print("3. 'custom': Enter your own list of keywords manually.")
+    if keyword_option is not None:
+        option = keyword_option
+    else:
+        print("\nHow would you like to proceed with the suggested keywords?")
+        print("1. 'all': Use all the suggested keywords for searching.")
+        print("2. 'select': Choose specific keywords by their ranks.")
+        print("3. 'custom': Enter your own list of keywords manually.")
 
-    while True:
-        option = input("\nChoose an option ('all', 'select', or 'custom'): ").strip().lower()
-        if option in ["all", "select", "custom"]:
-            break
-        print("Invalid option. Please try again.")
+        while True:
+            option = input("\nChoose an option ('all', 'select', or 'custom'): ").strip().lower()
+            if option in ["all", "select", "custom"]:
+                break
+            print("Invalid option. Please try again.")
 
     # Determine the final list of keywords based on the user's choice
     if option == "all":
         keywords = keyword_list
         print("\nUsing all suggested keywords for the search.")
+    elif option == "select" and keyword_ranks is not None:
+        keywords = _select_by_ranks(keyword_list, keyword_ranks)
+        print("\nUsing the following keywords:", keywords)
     elif option == "select":
         print("\nAvailable keywords with their ranks:")
         for i, keyword in enumerate(keyword_list, 1):
@@ -103,6 +209,11 @@ def topic_to_survey(
                     print(f"Please enter ranks between 1 and {len(keyword_list)}.")
             except ValueError:
                 print("Invalid input. Please enter valid integers separated by commas.")
+    elif option == "custom" and custom_keywords is not None:
+        keywords = [kw.strip() for kw in custom_keywords if kw.strip()]
+        if not keywords:
+            raise ValueError("No valid custom keywords were given.")
+        print("\nUsing custom keywords for the search:", keywords)
     elif option == "custom":
         while True:
             custom_input = input(
@@ -116,6 +227,8 @@ def topic_to_survey(
             else:
                 print("No valid keywords entered. Please try again.")
 
+    # Avoid searching and downloading the same articles twice for duplicate keywords
+    keywords = deduplicate_keywords(keywords)
     print("\nFinal keywords to search:", keywords)
 
     # Initialize and run the AutoSearch to find and download articles
@@ -158,19 +271,26 @@ def topic_to_survey(
     pdf_files_sorted = sorted(pdf_files, key=extract_score, reverse=True)
 
     # Ask the user how they would like to summarize the papers
-    print("\nHow would you like to summarize the papers?")
-    print("1. 'all': Summarize all papers in the organized folder.")
-    print("2. 'select': Choose specific papers by their ranks to summarize.")
+    if summary_option is None:
+        print("\nHow would you like to summarize the papers?")
+        print("1. 'all': Summarize all papers in the organized folder.")
+        print("2. 'select': Choose specific papers by their ranks to summarize.")
 
-    while True:
-        summary_option = input("\nChoose an option ('all' or 'select'): ").strip().lower()
-        if summary_option in ["all", "select"]:
-            break
-        print("Invalid option. Please try again.")
+        while True:
+            summary_option = input("\nChoose an option ('all' or 'select'): ").strip().lower()
+            if summary_option in ["all", "select"]:
+                break
+            print("Invalid option. Please try again.")
 
     if summary_option == "all":
         target_files = pdf_files_sorted
         print("\nSummarizing all papers in the organized folder.")
+    elif summary_option == "select" and summary_ranks is not None:
+        target_files = _select_by_ranks(pdf_files_sorted, summary_ranks)
+        print(
+            "\nSummarizing the following papers:",
+            [os.path.basename(file) for file in target_files],
+        )
     elif summary_option == "select":
         print("\nAvailable papers with their ranks:")
         for i, file_path in enumerate(pdf_files_sorted, 1):
@@ -196,59 +316,201 @@ def topic_to_survey(
             except ValueError:
                 print("Invalid input. Please enter valid integers separated by commas.")
 
-    # Summarize the selected papers and accumulate the cost
-    summary_cost = 0
+    # Identical prompts (same model and paper text) are answered from the cache on reruns, however
+    # long after the first run
+    response_cache = (
+        ResponseCache(os.path.join(destination_folder, "llm_cache.sqlite"), ttl=None)
+        if use_llm_cache
+        else None
+    )
+
+    # One GPT handler is shared by all papers, so its client and connections are set up once
+    OpenAI_instance = OpenAI_interface(key, model=model)
+
+    # Extract the text of all selected papers in parallel once; both the summaries and the
+    # code availability check below read it from the cache
+    text_cache_folder = os.path.join(destination_folder, ".text_cache")
+    cache_paper_texts(target_files, text_cache_folder)
+
+    # Summarize the selected papers concurrently and accumulate the cost
+    summary_instances = []
     for file_path in target_files:
         print(f"\nProcessing file: {os.path.basename(file_path)}")
-        auto_survey_instance = AutoSurvey(
-            key,
-            model,
-            file_path,
-            False,
-            "summarize_computer_science",
-            storage_path=os.path.join(destination_folder, "summaries.json"),
+        summary_instances.append(
+            AutoSurvey(
+                key,
+                model,
+                file_path,
+                False,
+                "summarize_computer_science",
+                storage_path=os.path.join(destination_folder, "summaries.json"),
+                response_cache=response_cache,
+                text_cache_folder=text_cache_folder,
+                OpenAI_instance=OpenAI_instance,
+            )
         )
-        auto_survey_instance.run()
-        summary_cost += auto_survey_instance.cost_accumulation
+    summary_cost = _run_surveys(summary_instances, max_concurrency)
 
     print(f"\nTotal cost for summarizing all files: {summary_cost}")
     print("\nThe summaries for all selected files are printed below:")
     print_summaries(os.path.join(destination_folder, "summaries.json"))
 
     # Ask the user if they want to check the code availability of the articles
-    while True:
-        check_code = (
-            input("\nWould you like to check the code availability of the articles? (yes/no): ")
-            .strip()
-            .lower()
-        )
-        if check_code in ["yes", "no"]:
-            break
-        print("Invalid input. Please enter 'yes' or 'no'.")
+    if check_code is None:
+        while True:
+            answer = (
+                input(
+                    "\nWould you like to check the code availability of the articles? (yes/no): "
+                )
+                .strip()
+                .lower()
+            )
+            if answer in ["yes", "no"]:
+                break
+            print("Invalid input. Please enter 'yes' or 'no'.")
+        check_code = answer == "yes"
 
     # Check code availability for the summarized articles and accumulate the cost
-    code_check_cost = 0
-    if check_code == "yes":
+    code_check_cost = 0.0
+    if check_code:
         print("\nChecking code availability for the summarized articles...")
-        for file_path in target_files:
-            print(f"\nChecking code availability for: {os.path.basename(file_path)}")
-            auto_survey_instance = AutoSurvey(
-                key, model, file_path, False, "information_retrieval"
-            )
-            prompt = base_prompt_formatted()
-
-            # Call `test_github_link` and pass its result as a list
-            try:
-                auto_survey_instance.run(prompt, test_github_link)
-            except Exception as exception:
-                print(exception)
-                print("The traceback is:")
-                traceback.print_exc()
-
-            code_check_cost += auto_survey_instance.cost_accumulation
+        # Several articles are checked per inquiry; `test_github_link` validates each answer
+        code_check_instance = AutoSurveyBatch(
+            key,
+            model,
+            target_files,
+            max_concurrency=max_concurrency,
+            response_cache=response_cache,
+            text_cache_folder=text_cache_folder,
+            OpenAI_instance=OpenAI_instance,
+        )
+        code_check_instance.run(base_prompt_formatted(), test_github_link)
+        code_check_cost = code_check_instance.cost_accumulation
 
     print(f"\nTotal cost for checking code availability: {code_check_cost} USD")
     print(
         f"Total cost for the entire process (summaries + code availability check): "
         f"{summary_cost + code_check_cost} USD"
     )
+    if response_cache is not None:
+        print(
+            f"LLM responses reused from the cache: {response_cache.hits} of "
+            f"{response_cache.hits + response_cache.misses} inquiries"
+        )
+
+
+def _parse_ranks(value: str) -> list[int]:
+    """Parse comma-separated ranks, e.g. "1,3,5", for the command-line interface."""
+    try:
+        return [int(rank.strip()) for rank in value.split(",") if rank.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid ranks: {value!r}.")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Command-line entry point of ``topic_to_survey``.
+
+    Every choice that is not given on the command line is asked interactively, so the process
+    runs without any prompt when the topic, keywords, summary and code check options are given.
+
+    Args:
+        argv: Command-line arguments. Defaults to ``sys.argv[1:]``.
+
+    Example:
+        $ python -m auto_research.applications.surveys --topic "AI in healthcare" \\
+            --keywords all --summary all --check-code
+    """
+    parser = argparse.ArgumentParser(
+        description="Search, download, summarize and check the code availability of papers."
+    )
+    parser.add_argument("--topic", help="Research topic or question.")
+    parser.add_argument(
+        "--keywords",
+        dest="keyword_option",
+        choices=["all", "select", "custom"],
+        help="How to use the suggested keywords.",
+    )
+    parser.add_argument(
+        "--keyword-ranks",
+        type=_parse_ranks,
+        help="Comma-separated ranks of the suggested keywords to use with '--keywords select'.",
+    )
+    parser.add_argument(
+        "--custom-keywords",
+        type=lambda value: value.split(","),
+        help="Comma-separated keywords to use with '--keywords custom'.",
+    )
+    parser.add_argument(
+        "--summary",
+        dest="summary_option",
+        choices=["all", "select"],
+        help="Which papers to summarize.",
+    )
+    parser.add_argument(
+        "--summary-ranks",
+        type=_parse_ranks,
+        help="Comma-separated ranks of the papers to summarize with '--summary select'.",
+    )
+    parser.add_argument(
+        "--check-code",
+        dest="check_code",
+        action="store_const",
+        const=True,
+        help="Check the code availability of the articles.",
+    )
+    parser.add_argument(
+        "--no-check-code",
+        dest="check_code",
+        action="store_const",
+        const=False,
+        help="Skip the code availability check.",
+    )
+    parser.add_argument("--num-results", type=int, default=30)
+    parser.add_argument("--sort-by", default="relevance")
+    parser.add_argument("--date-cutoff", default="2024-12-01")
+    parser.add_argument("--score-threshold", type=float, default=0.5)
+    parser.add_argument("--destination-folder", default="papers")
+    parser.add_argument("--model", default="gpt-4o-mini")
+    parser.add_argument("--api-key-path", default="../")
+    parser.add_argument("--api-key-type", default="OpenAI")
+    parser.add_argument("--max-concurrency", type=int, default=4)
+    parser.add_argument(
+        "--no-llm-cache", dest="use_llm_cache", action="store_false", help="Disable the LLM cache."
+    )
+    parser.add_argument(
+        "--quiet", action="store_true", help="Do not print the progress of the paper analysis."
+    )
+    args = parser.parse_args(argv)
+
+    # Only configure the package logger so that the logs of the HTTP clients stay quiet
+    package_logger = logging.getLogger("auto_research")
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    package_logger.addHandler(handler)
+    package_logger.setLevel(logging.WARNING if args.quiet else logging.INFO)
+    package_logger.propagate = False
+
+    topic_to_survey(
+        num_results=args.num_results,
+        sort_by=args.sort_by,
+        date_cutoff=args.date_cutoff,
+        score_threshold=args.score_threshold,
+        destination_folder=args.destination_folder,
+        model=args.model,
+        api_key_path=args.api_key_path,
+        api_key_type=args.api_key_type,
+        use_llm_cache=args.use_llm_cache,
+        max_concurrency=args.max_concurrency,
+        topic=args.topic,
+        keyword_option=args.keyword_option,
+        keyword_ranks=args.keyword_ranks,
+        custom_keywords=args.custom_keywords,
+        summary_option=args.summary_option,
+        summary_ranks=args.summary_ranks,
+        check_code=args.check_code,
+    )
+
+
+if __name__ == "__main__":
+    main()
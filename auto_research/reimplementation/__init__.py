@@ -0,0 +1,52 @@
+# mypy: disable-error-code="assignment"
+# flake8: noqa
+from __future__ import annotations
+
+import importlib
+import os
+import pkgutil
+from types import ModuleType
+
+
+# Discover all subcomponents in the current directory; they are imported on first access
+_SUBMODULES = frozenset(
+    module_name for _, module_name, _ in pkgutil.iter_modules([os.path.dirname(__file__)])
+)
+__all__ = sorted(_SUBMODULES)  # Define public API
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name in _SUBMODULES:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module  # Later lookups no longer go through __getattr__
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _SUBMODULES)
+
+
+"""
+Subcomponents are imported lazily through the module-level __getattr__ (PEP 562): importing the
+package only lists its subcomponents, and a subcomponent (with its own, possibly heavy,
+dependencies) is imported the first time it is accessed as an attribute of the package.
+
+Dynamic imports, like the code here, are generally safe if the following conditions are met:
+1. Unique Submodule Names: All submodules have distinct names to avoid naming collisions in 
+globals().
+2. No Top-Level Side Effects: Submodules do not execute significant logic or alter state at the 
+time of import.
+3. Controlled Import Scope: Dynamically imported modules are only accessible within their parent 
+namespace and not exposed at higher levels unless explicitly re-exported.
+4. Modular and Lightweight Submodules: Submodules are small and modular, minimizing performance or 
+memory overhead.
+
+This code does no support cross-level imports.
+
+This code disables the mypy error code "assignment" to suppress the checks for 
+reassignment of variables.
+
+This code disables the flake8 error code "noqa" to suppress the checks for
+flake8 errors.
+"""
@@ -1,6 +1,22 @@
 from __future__ import annotations
 
-from urllib.parse import urlparse
+import re
+
+
+__all__ = ["BASE_PROMPT", "base_prompt_formatted", "is_valid_url", "test_github_link"]
+
+# A scheme (e.g., 'http') followed by "://" and a non-empty netloc (domain)
+_URL_RE = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*://[^/?#\s]+")
+# An http(s) URL whose host is github.com or one of its subdomains
+_GITHUB_URL_RE = re.compile(r"^https?://(?:[\w-]+\.)*github\.com(?::\d+)?(?:[/?#]|$)", re.I)
+
+# The information requested by `base_prompt_formatted`; it never changes, so build it once
+BASE_PROMPT = (
+    "Information about the availability of a GitHub link for the code that implements the"
+    " method. "
+    'If the link is not available, your answer should be "not available". '
+    "Your answer should only be the GitHub link or 'not available' and nothing else."
+)
 
 
 def is_valid_url(url: str) -> bool:
@@ -19,12 +35,7 @@ def is_valid_url(url: str) -> bool:
         >>> is_valid_url("invalid-url")
         False
     """
-    try:
-        result = urlparse(url)
-        # Check if the scheme (e.g., 'http') and netloc (domain) are present.
-        return all([result.scheme, result.netloc])
-    except Exception:
-        return False
+    return _URL_RE.match(url) is not None
 
 
 def test_github_link(response: str) -> str:
@@ -38,7 +49,7 @@ def test_github_link(response: str) -> str:
         str: The original response if it passes the validation.
 
     Raises:
-        AssertionError: If the response is not a valid URL or does not contain "github.com".
+        AssertionError: If the response is not a valid URL or its host is not "github.com".
 
     Example:
         >>> test_github_link("https://github.com/user/repo")
@@ -46,11 +57,10 @@ def test_github_link(response: str) -> str:
         >>> test_github_link("not available")
         'not available'
     """
-    if response != "not available":
+    if response != "not available" and _GITHUB_URL_RE.match(response) is None:
+        # Only report which check failed when the fast path rejects the response.
         assert is_valid_url(response), f"The information is\n{response}\ninstead of a valid URL."
-        assert (
-            "github.com" in response
-        ), f"The information is\n{response}\ninstead of a valid GitHub link."
+        raise AssertionError(f"The information is\n{response}\ninstead of a valid GitHub link.")
     return response
 
 
@@ -68,10 +78,4 @@ def base_prompt_formatted() -> str:
          method. If the link is not available, your answer should be "not available". Your answer
           should only be the GitHub link or "not available" and nothing else.'
     """
-    target_information = (
-        "Information about the availability of a GitHub link for the code that implements the"
-        " method. "
-        'If the link is not available, your answer should be "not available". '
-        "Your answer should only be the GitHub link or 'not available' and nothing else."
-    )
-    return target_information
+    return BASE_PROMPT
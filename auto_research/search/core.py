@@ -1,21 +1,63 @@
 from __future__ import annotations
 
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 import datetime
 import os
-import shutil
-import time
+import re
+import threading
 import traceback
 from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import Optional
 
+import numpy as np
 from scholarly import scholarly
 from tqdm import tqdm
 
 from auto_research.search.data_retrival import download_pdf
 from auto_research.search.data_retrival import get_arxiv_paper_details
 from auto_research.search.data_retrival import get_paper_details_from_semantic_scholar
+from auto_research.search.data_retrival import get_papers_from_semantic_scholar
+from auto_research.search.data_retrival import is_pdf_link
+from auto_research.search.data_retrival import search_semantic_scholar
+from auto_research.search.files_management import archive_folder
 from auto_research.search.files_management import sanitize_filename
+from auto_research.search.information import append_journal_record
 from auto_research.search.information import extract_exact_date
+from auto_research.search.information import normalize_title
+from auto_research.search.information import PaperRecord
+from auto_research.search.information import read_journal
 from auto_research.search.information import save_meta_data
+from auto_research.search.keywords import deduplicate_keywords
+from auto_research.utils.cache import ResponseCache
+from auto_research.utils.rate_limit import RateLimiter
+
+
+# Journal of the papers downloaded by a search that has not completed yet; it allows a search
+# interrupted before its metadata is saved to skip the papers already downloaded
+_JOURNAL_FILE_NAME = "metadata.jsonl"
+
+# Number of results on a page of Google Scholar, which are fetched with a single request
+_SCHOLAR_PAGE_SIZE = 10
+
+# Maximum number of lookups kept in memory by AutoSearch.cached_lookup
+_LOOKUP_MEMO_SIZE = 8192
+
+# Number of seconds during which a failed lookup is not retried, when the search cache is enabled
+_FAILED_LOOKUP_TTL = 3600
+
+# Identifier of a paper in a link to arXiv, in the current (1706.03762) or old (hep-th/9901001)
+# format
+_ARXIV_ID_PATTERN = re.compile(
+    r"arxiv\.org/(?:abs|pdf)/(\d{4}\.\d{4,5}|[a-z\-]+(?:\.[A-Z]{2})?/\d{7})"
+)
+
+# Default location of the cache of search results, shared by all searches of the user
+DEFAULT_SEARCH_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".auto_research", "search_cache.sqlite"
+)
 
 
 class AutoSearch:
@@ -27,7 +69,10 @@ class AutoSearch:
         keywords (str | list[str]): The keyword(s) to search for. If a string, performs a single
             search. If a list, performs multiple searches.
         num_results (int): The number of results to retrieve.
-        delay (int): Added delay (in seconds) between requests to avoid rate limiting.
+        delay (int): Minimum delay (in seconds) between two requests to the same source (Google
+            Scholar, Semantic Scholar or arXiv) to avoid rate limiting. Google Scholar results are
+            requested a page of ten at a time. Requests to different sources do not wait for each
+            other.
         sort_by (str): Sorting criteria for the Google Scholar search engine ("date" or "relevance").
         date_cutoff (str): The cutoff date for papers when sorting by date (format: "YYYY-MM-DD").
         score_threshold (float): The minimum combined score for papers to be displayed/downloaded.
@@ -54,12 +99,26 @@ class AutoSearch:
         auto_destination (bool): Whether to automatically generate the destination folder name.
         destination_folder (str): The folder where downloaded papers will be saved.
         zip_folder (bool): Whether to zip the downloaded papers.
+        max_workers (int): The number of papers whose details are retrieved from Semantic Scholar
+            and arXiv concurrently.
+        download_workers (int): The number of papers downloaded concurrently.
+        filter_by_abstract (bool): Whether to skip papers whose abstract does not contain the
+            searched keyword, when sorting by date. Sorting by date returns the most recent
+            papers, which are often only loosely related to the keyword.
+        search_cache (Optional[ResponseCache]): Persistent cache of Google Scholar search results
+            and of the details retrieved from Semantic Scholar and arXiv. None if caching is
+            disabled.
 
     Example:
         >>> search = AutoSearch("machine learning", num_results=10)
         >>> search.run()
     """  # noqa: E501
 
+    # Successful lookups of paper details, keyed by source and normalized title; shared by all
+    # instances so that the same paper is never requested twice in a process
+    _lookup_memo: dict[tuple[str, str], Any] = {}
+    _lookup_memo_lock = threading.Lock()
+
     def __init__(
         self,
         keywords: str | list[str],
@@ -72,6 +131,11 @@ class AutoSearch:
         auto_destination: bool = False,
         destination_folder: str = "search_results",
         zip_folder: bool = True,
+        max_workers: int = 4,
+        download_workers: int = 8,
+        filter_by_abstract: bool = False,
+        cache_path: Optional[str] = DEFAULT_SEARCH_CACHE_PATH,
+        cache_ttl: Optional[float] = 86400,
     ) -> None:
         """
         Initialize the AutoSearch class with the given parameters.
@@ -79,7 +143,8 @@ class AutoSearch:
         Args:
             keywords (str | list[str]): The keyword(s) to search for.
             num_results (int): The number of results to retrieve.
-            delay (int): Delay between requests.
+            delay (int): Minimum delay between two requests to the same source (Google Scholar,
+                Semantic Scholar or arXiv).
             sort_by (str): Sorting criteria ("date" or "relevance").
             date_cutoff (str): Cutoff date for date-based search (format: "YYYY-MM-DD").
             score_threshold (float): Minimum combined score for papers.
@@ -87,6 +152,14 @@ class AutoSearch:
             auto_destination (bool): Whether to auto-generate the destination folder name.
             destination_folder (str): Folder to save downloaded papers.
             zip_folder (bool): Whether to zip the downloaded papers.
+            max_workers (int): Number of papers whose details are retrieved concurrently.
+            download_workers (int): Number of papers downloaded concurrently.
+            filter_by_abstract (bool): Whether to skip papers whose abstract does not contain the
+                searched keyword, when sorting by date.
+            cache_path (Optional[str]): Path to the SQLite file caching search results and paper
+                details across runs. If None, nothing is cached.
+            cache_ttl (Optional[float]): Number of seconds after which cached results expire. If
+                None, they never expire.
         """
         self.keywords = keywords
         self.num_results = num_results
@@ -98,8 +171,34 @@ class AutoSearch:
         self.auto_destination = auto_destination
         self.destination_folder = destination_folder
         self.zip_folder = zip_folder
+        self.max_workers = max_workers
+        self.download_workers = download_workers
+        self.filter_by_abstract = filter_by_abstract
+        # Parse the cutoff date of date-based search and compile the keyword patterns once
+        # rather than per search
+        self._date_cutoff_date: Optional[datetime.date] = (
+            datetime.datetime.strptime(date_cutoff, "%Y-%m-%d").date()
+            if sort_by == "date"
+            else None
+        )
+        self._keyword_patterns = {
+            keyword: re.compile(rf"\b{re.escape(keyword.strip())}\b", re.IGNORECASE)
+            for keyword in ([keywords] if isinstance(keywords, str) else keywords)
+        }
+        self.search_cache = (
+            ResponseCache(cache_path, ttl=cache_ttl) if cache_path is not None else None
+        )
+        # Venue, abstract and arXiv link of the papers already retrieved in this instance, keyed
+        # by normalized title, so that papers found by several keywords are retrieved only once
+        self._paper_details: dict[str, tuple[str, str, str]] = {}
+        # One rate limiter per source, shared by all threads retrieving paper details
+        self._rate_limiters = {
+            "scholar": RateLimiter(delay),
+            "semantic_scholar": RateLimiter(delay),
+            "arxiv": RateLimiter(delay),
+        }
 
-    def search_papers_by_keyword(self, keyword: str) -> list[dict[str, Any]]:
+    def search_papers_by_keyword(self, keyword: str) -> list[PaperRecord]:
         """
         Search for papers by a given keyword and retrieve their details.
 
@@ -107,7 +206,7 @@ class AutoSearch:
             keyword (str): The keyword to search for.
 
         Returns:
-            list[dict[str, Any]]: A list of dictionaries containing paper details.
+            list[PaperRecord]: A list of dictionaries containing paper details.
 
         Example:
             >>> search = AutoSearch("machine learning")
@@ -115,32 +214,125 @@ class AutoSearch:
             >>> len(papers) > 0
             True
         """
-        search_query = scholarly.search_pubs(keyword, sort_by=self.sort_by)
-        papers_info: list[dict[str, Any]] = []
+        if self.search_cache is not None:
+            search_key = ResponseCache.make_key(
+                "scholar",
+                keyword,
+                self.sort_by,
+                self.date_cutoff,
+                str(self.num_results),
+                str(self.recency_weight),
+                str(self.score_threshold),
+                str(self.filter_by_abstract),
+            )
+            cached_papers_info = self.search_cache.get(search_key)
+            if cached_papers_info is not None:
+                print(f"Loaded {len(cached_papers_info)} papers from the search cache")
+                return cached_papers_info
+
+        with self._rate_limiters["scholar"]:
+            search_query = scholarly.search_pubs(keyword, sort_by=self.sort_by)
+        papers_info: list[PaperRecord] = []
 
         if self.sort_by == "date":
             print(f"Begin searching all papers up until {self.date_cutoff}")
-            date_cutoff = datetime.datetime.strptime(self.date_cutoff, "%Y-%m-%d").date()
+            # The cutoff date is parsed here if sorting by date was enabled after initialization
+            date_cutoff = (
+                self._date_cutoff_date
+                or datetime.datetime.strptime(self.date_cutoff, "%Y-%m-%d").date()
+            )
             disable = False  # Enable progress bar for date-based search
             total = None  # No total for date-based search
         else:
             disable = False
             total = self.num_results  # Total number of results for non-date-based search
 
+        keyword_pattern = self._keyword_patterns.get(keyword) or re.compile(
+            rf"\b{re.escape(keyword.strip())}\b", re.IGNORECASE
+        )
+
+        # The current date is the same for all papers of a search
+        current_date = datetime.datetime.now().date()
+        current_year = current_date.year
+
+        # Citation counts and ages of the papers, from which the combined scores of a whole page
+        # of results are computed at once
+        citation_counts: list[float] = []
+        ages: list[float] = []
+        combined_scores = np.empty(0)
+
+        # Additional details are retrieved by worker threads while Google Scholar is still being
+        # searched, since both are network-bound. Most papers are usually also found by
+        # searching Semantic Scholar for the same keyword, which replaces one request per paper
+        # with a single request; most of the others are found with a single batch request per
+        # page of results.
+        executor = ThreadPoolExecutor(max_workers=max(1, self.max_workers))
+        venues_future: Optional[Future[dict[str, Optional[str]]]] = None
+        retrievals: list[Future[None]] = []
+
+        def complete_venues(page: list[PaperRecord]) -> dict[str, Optional[str]]:
+            assert venues_future is not None
+            return self.complete_semantic_scholar_venues(page, venues_future.result())
+
+        def retrieve(
+            paper_info: PaperRecord, page_venues_future: Future[dict[str, Optional[str]]]
+        ) -> None:
+            self.retrieve_paper_details(paper_info, page_venues_future.result())
+
+        def score_and_retrieve() -> None:
+            # Score the papers found since the last call. Only papers that reach the score
+            # threshold are displayed and downloaded, so the others keep their Google Scholar
+            # details and cost no additional requests.
+            nonlocal combined_scores, venues_future
+            start = len(combined_scores)
+            # Papers dated in the future, e.g. "in press" papers, are scored as recent papers
+            # rather than getting an infinite or undefined score
+            new_ages = np.maximum(np.asarray(ages[start:], dtype=np.float64), 1.0)
+            new_scores = (
+                np.asarray(citation_counts[start:], dtype=np.float64)
+                / new_ages**self.recency_weight
+            )
+            combined_scores = np.concatenate((combined_scores, new_scores))
+            page: list[PaperRecord] = []
+            for paper_info, combined_score in zip(papers_info[start:], new_scores.tolist()):
+                paper_info["combined_score"] = combined_score
+                if combined_score >= self.score_threshold:
+                    page.append(paper_info)
+            if not page:
+                return
+
+            # The tasks are run in submission order, so a task only waits for tasks that are
+            # already running
+            if venues_future is None:
+                venues_future = executor.submit(self.search_semantic_scholar_venues, keyword)
+            page_venues_future = executor.submit(complete_venues, page)
+            retrievals.extend(
+                executor.submit(retrieve, paper_info, page_venues_future) for paper_info in page
+            )
+
+        def paced_results() -> Iterator[dict[str, Any]]:
+            # Google Scholar blocks clients sending requests too quickly, and scholarly requests
+            # the next page of results once the results of a page are consumed
+            results = iter(search_query)
+            position = 0
+            while True:
+                if position and position % _SCHOLAR_PAGE_SIZE == 0:
+                    self._rate_limiters["scholar"].acquire()
+                try:
+                    paper = next(results)
+                except StopIteration:
+                    return
+                position += 1
+                yield paper
+
         # Initialize tqdm progress bar
         with tqdm(total=total, desc="Searching papers", disable=disable) as pbar:
             count = 0
             try:
-                for paper in search_query:
-                    title = paper.get("bib", {}).get("title", "Title not available")
-                    citation_count = paper.get("num_citations", 0)
-                    publication_year = paper.get("bib", {}).get(
-                        "pub_year", datetime.datetime.now().year
-                    )
-                    authors = paper.get("bib", {}).get("author", "Authors not available")
-                    venue = paper.get("bib", {}).get("venue", "Venue not available")
-
-                    # Handle date-based search
+                for paper in paced_results():
+                    # Handle date-based search before extracting any other detail, since the
+                    # paper may be skipped or end the search
+                    date: Optional[datetime.date] = None
                     if self.sort_by == "date":
                         date = extract_exact_date(paper)
                         if date is None:
@@ -148,6 +340,18 @@ class AutoSearch:
                             continue
                         if date < date_cutoff:  # Stop if the paper is older than the cutoff date
                             break
+                        if self.filter_by_abstract and not keyword_pattern.search(
+                            (paper.get("bib") or {}).get("abstract", "")
+                        ):
+                            # Skip this paper if its abstract does not mention the keyword
+                            continue
+
+                    bib = paper.get("bib") or {}
+                    title = bib.get("title", "Title not available")
+                    citation_count = paper.get("num_citations", 0)
+                    publication_year = bib.get("pub_year", current_year)
+                    authors = bib.get("author", "Authors not available")
+                    venue = bib.get("venue", "Venue not available")
 
                     # Format authors if they are in a list
                     if isinstance(authors, list):
@@ -161,57 +365,35 @@ class AutoSearch:
                         try:
                             publication_year = int(publication_year)
                         except ValueError:
-                            publication_year = datetime.datetime.now().year
-
-                    # Calculate combined score based on sorting criteria
-                    if self.sort_by == "date":
-                        date = extract_exact_date(paper)
-                        if date is None:
-                            # Skip this paper if no valid date is found
-                            continue
+                            publication_year = current_year
 
-                        current_date = datetime.datetime.now().date()
+                    # Age of the paper for the combined score based on sorting criteria, reusing
+                    # the date extracted above for date-based search
+                    if date is not None:
                         days_ago = (current_date - date).days  # This is now type-safe
-                        combined_score = citation_count / (
-                            ((365 + days_ago) / 365) ** self.recency_weight
-                        )
+                        ages.append((365 + days_ago) / 365)
                     else:
-                        current_year = datetime.datetime.now().year
-                        recency = current_year + 1 - publication_year
-                        combined_score = citation_count / (recency**self.recency_weight)
-
-                    # Get additional details from Semantic Scholar
-                    semantic_scholar_results = get_paper_details_from_semantic_scholar(title)
-                    if semantic_scholar_results is not None:
-                        _, venue_new = semantic_scholar_results
-                        if venue_new:
-                            venue = venue_new
-
-                    # Get details from arXiv
-                    arxiv_results = get_arxiv_paper_details(title)
-                    if arxiv_results is not None:
-                        _, abstract, arxiv_link, _ = arxiv_results
-                    else:
-                        abstract = "Abstract not available"
-                        arxiv_link = "Link not available"
+                        ages.append(current_year + 1 - publication_year)
+                    citation_counts.append(citation_count)
 
-                    # Append paper details to the list
+                    # Append paper details to the list; the abstract and the arXiv link are
+                    # retrieved by the worker threads
                     papers_info.append(
                         {
                             "title": title,
-                            "abstract": abstract,
+                            "abstract": "Abstract not available",
                             "citation_count": citation_count,
                             "publication_year": publication_year,
                             "venue": venue,
                             "authors": authors,
                             "link": link,
-                            "arxiv_link": arxiv_link,
-                            "combined_score": combined_score,
+                            "arxiv_link": "Link not available",
                         }
                     )
 
-                    # Impose a delay between requests to avoid rate limiting
-                    time.sleep(self.delay)
+                    # Score a page of results at a time
+                    if len(papers_info) % _SCHOLAR_PAGE_SIZE == 0:
+                        score_and_retrieve()
 
                     # Update progress bar
                     pbar.update(1)
@@ -229,18 +411,226 @@ class AutoSearch:
                 print(f"An error occurred: {e}")
                 traceback.print_exc()
 
+        # Score the remaining papers and wait for all details
+        with executor:
+            score_and_retrieve()
+            for retrieval in tqdm(retrievals, desc="Retrieving paper details"):
+                retrieval.result()
+
         # Sort papers by combined score in descending order
-        papers_info.sort(key=lambda x: x["combined_score"], reverse=True)
+        order = np.argsort(-combined_scores, kind="stable")
+        papers_info = [papers_info[idx] for idx in order]
+
+        if self.search_cache is not None and papers_info:
+            self.search_cache.put(search_key, papers_info)
         return papers_info
 
-    def display_and_download(
-        self, papers_info: list[dict[str, Any]], verbose: bool = True
+    def search_semantic_scholar_venues(self, keyword: str) -> dict[str, Optional[str]]:
+        """
+        Search Semantic Scholar for a keyword and return the venues of the papers found.
+
+        The venues are kept in the search cache if it is enabled. Searches that fail or find
+        nothing are not cached.
+
+        Args:
+            keyword (str): The keyword to search for.
+
+        Returns:
+            dict[str, Optional[str]]: The venue of each paper found, keyed by normalized title.
+
+        Example:
+            >>> search = AutoSearch("machine learning")
+            >>> venues = search.search_semantic_scholar_venues("transformers")
+        """
+        if self.search_cache is not None:
+            key = ResponseCache.make_key("semantic_scholar_search", keyword)
+            venues = self.search_cache.get(key)
+            if venues is not None:
+                return venues
+
+        with self._rate_limiters["semantic_scholar"]:
+            results = search_semantic_scholar(keyword)
+        venues = {
+            normalize_title(result["title"]): result.get("venue")
+            for result in results
+            if result.get("title")
+        }
+        if venues and self.search_cache is not None:
+            self.search_cache.put(key, venues)
+        return venues
+
+    def complete_semantic_scholar_venues(
+        self,
+        papers_info: list[PaperRecord],
+        semantic_scholar_venues: dict[str, Optional[str]],
+    ) -> dict[str, Optional[str]]:
+        """
+        Complete the venues found by a keyword search with the venues of papers linked to arXiv.
+
+        The papers that were not found by the keyword search but link to arXiv are looked up by
+        their arXiv identifier, with a single request to the batch endpoint of Semantic Scholar.
+
+        Args:
+            papers_info (list[PaperRecord]): The papers whose venues are needed.
+            semantic_scholar_venues (dict[str, Optional[str]]): The venues found by the keyword
+                search, keyed by normalized title.
+
+        Returns:
+            dict[str, Optional[str]]: The venues found by the keyword search and the batch
+            request, keyed by normalized title.
+
+        Example:
+            >>> search = AutoSearch("machine learning")
+            >>> venues = search.search_semantic_scholar_venues("transformers")
+            >>> paper = {
+            ...     "title": "Attention is All You Need",
+            ...     "link": "https://arxiv.org/abs/1706.03762",
+            ... }
+            >>> venues = search.complete_semantic_scholar_venues([paper], venues)
+        """
+        # The titles returned by Semantic Scholar may differ from the (often truncated) titles
+        # found by Google Scholar, so the venues are keyed by the titles of the requested papers
+        titles = []
+        paper_ids = []
+        for paper_info in papers_info:
+            title = normalize_title(paper_info["title"])
+            if title not in semantic_scholar_venues:
+                match = _ARXIV_ID_PATTERN.search(paper_info["link"])
+                if match:
+                    titles.append(title)
+                    paper_ids.append(f"ARXIV:{match.group(1)}")
+        if not paper_ids:
+            return semantic_scholar_venues
+
+        with self._rate_limiters["semantic_scholar"]:
+            results = get_papers_from_semantic_scholar(paper_ids)
+        venues = dict(semantic_scholar_venues)
+        venues.update(
+            (title, result.get("venue"))
+            for title, result in zip(titles, results)
+            if result is not None
+        )
+        return venues
+
+    def cached_lookup(self, source: str, title: str, lookup: Callable[[str], Any]) -> Any:
+        """
+        Look up the details of a paper by its title, using the search cache when possible.
+
+        Successful lookups are kept in memory for the whole process and, if enabled, in the
+        search cache. Titles that differ only in letter case, punctuation or whitespace share the
+        same entry. Failed lookups (None), e.g. papers unknown to the source or requests rejected
+        by a rate-limited source, are recorded in the search cache for an hour, during which they
+        are not retried. Requests actually sent to the source are rate-limited per source.
+
+        Args:
+            source (str): The name of the source, e.g. "semantic_scholar" or "arxiv".
+            title (str): The title of the paper.
+            lookup (Callable[[str], Any]): The function retrieving the details from the source.
+
+        Returns:
+            Any: The details returned by the lookup function.
+
+        Example:
+            >>> search = AutoSearch("machine learning")
+            >>> search.cached_lookup("arxiv", "Attention is All You Need", get_arxiv_paper_details)
+        """
+        memo_key = (source, normalize_title(title))
+        result = self._lookup_memo.get(memo_key)
+        if result is not None:
+            return result
+
+        if self.search_cache is not None:
+            key = ResponseCache.make_key(*memo_key)
+            result = self.search_cache.get(key)
+            if result is None:
+                failure_key = ResponseCache.make_key("failed", *memo_key)
+                if self.search_cache.get(failure_key, max_age=_FAILED_LOOKUP_TTL):
+                    return None
+
+        if result is None:
+            with self._rate_limiters[source]:
+                result = lookup(title)
+            if result is None:
+                if self.search_cache is not None:
+                    self.search_cache.put(failure_key, True)
+                return None
+            if self.search_cache is not None:
+                self.search_cache.put(key, result)
+
+        with self._lookup_memo_lock:
+            if len(self._lookup_memo) >= _LOOKUP_MEMO_SIZE:
+                # Evict the oldest entry; dictionaries keep the insertion order
+                del self._lookup_memo[next(iter(self._lookup_memo))]
+            self._lookup_memo[memo_key] = result
+        return result
+
+    def retrieve_paper_details(
+        self,
+        paper_info: PaperRecord,
+        semantic_scholar_venues: Optional[dict[str, Optional[str]]] = None,
     ) -> None:
+        """
+        Retrieve the venue, abstract and arXiv link of a paper from Semantic Scholar and arXiv.
+
+        The details are updated in place. If the retrieval fails, the paper keeps its current
+        details. Papers already retrieved by this instance, e.g. for another keyword, reuse the
+        previously retrieved details.
+
+        Args:
+            paper_info (PaperRecord): The paper details, including its title.
+            semantic_scholar_venues (Optional[dict[str, Optional[str]]]): Venues already
+                retrieved from Semantic Scholar, keyed by normalized title. Papers found there
+                are not looked up again.
+
+        Example:
+            >>> search = AutoSearch("machine learning")
+            >>> paper_info = {"title": "Attention is All You Need", "venue": "NeurIPS"}
+            >>> search.retrieve_paper_details(paper_info)
+        """
+        normalized_title = normalize_title(paper_info["title"])
+        if normalized_title in self._paper_details:
+            (
+                paper_info["venue"],
+                paper_info["abstract"],
+                paper_info["arxiv_link"],
+            ) = self._paper_details[normalized_title]
+            return
+
+        try:
+            # Get additional details from Semantic Scholar
+            if semantic_scholar_venues and normalized_title in semantic_scholar_venues:
+                venue_new = semantic_scholar_venues[normalized_title]
+            else:
+                semantic_scholar_results = self.cached_lookup(
+                    "semantic_scholar",
+                    paper_info["title"],
+                    get_paper_details_from_semantic_scholar,
+                )
+                venue_new = semantic_scholar_results[1] if semantic_scholar_results else None
+            if venue_new:
+                paper_info["venue"] = venue_new
+
+            # Get details from arXiv
+            arxiv_results = self.cached_lookup(
+                "arxiv", paper_info["title"], get_arxiv_paper_details
+            )
+            if arxiv_results is not None:
+                _, paper_info["abstract"], paper_info["arxiv_link"], _ = arxiv_results
+
+            self._paper_details[normalized_title] = (
+                paper_info["venue"],
+                paper_info["abstract"],
+                paper_info["arxiv_link"],
+            )
+        except Exception as e:
+            print(f"Failed to retrieve the details of '{paper_info['title']}': {e}")
+
+    def display_and_download(self, papers_info: list[PaperRecord], verbose: bool = True) -> None:
         """
         Display the details of the papers and optionally download them.
 
         Args:
-            papers_info (list[dict[str, Any]]): A list of dictionaries containing paper details.
+            papers_info (list[PaperRecord]): A list of dictionaries containing paper details.
             verbose (bool): Whether to display detailed information.
 
         Example:
@@ -250,34 +640,30 @@ class AutoSearch:
         """
         break_flag = False
         current_date = datetime.datetime.now().strftime("%Y-%m-%d")
+        papers_to_download = []
         for idx, paper in enumerate(papers_info, start=1):
-            papers_info[idx - 1]["search_date"] = current_date
+            paper["search_date"] = current_date
             if paper["combined_score"] >= self.score_threshold:
-                print(f"\n\nPaper {idx}:")
-                print(f"Title: {paper['title']}")
+                # Display the paper with a single write, so that it is not interleaved with the
+                # output of other threads
+                lines = [f"\n\nPaper {idx}:", f"Title: {paper['title']}"]
                 if verbose:
-                    print(f"Abstract:\n\n{paper['abstract']}")
-                print(f"Combined Score: {paper['combined_score']}")
+                    lines.append(f"Abstract:\n\n{paper['abstract']}")
+                lines.append(f"Combined Score: {paper['combined_score']}")
                 if verbose:
-                    print(f"Citation count: {paper['citation_count']}")
-                    print(f"Year of publication: {paper['publication_year']}")
-                    print(f"Publication venue: {paper['venue']}")
-                    print(f"Authors: {paper['authors']}\n\n")
-                    print(f"Link: {paper['link']}")
-                    print(f"ArXiv Link: {paper['arxiv_link']}")
-                    if paper["link"] != "Link not available":
-                        sanitized_title = sanitize_filename(paper["title"])
-                        filename = f"{sanitized_title}.pdf"
-                        papers_info[idx - 1]["downloaded"] = True
-                        papers_info[idx - 1]["file_name"] = filename
-                        if not download_pdf(
-                            paper["link"], filename, folder=self.destination_folder
-                        ):
-                            print(f"Trying to download from ArXiv link: {paper['arxiv_link']}")
-                            if not download_pdf(
-                                paper["arxiv_link"], filename, folder=self.destination_folder
-                            ):
-                                papers_info[idx - 1]["downloaded"] = False
+                    lines += [
+                        f"Citation count: {paper['citation_count']}",
+                        f"Year of publication: {paper['publication_year']}",
+                        f"Publication venue: {paper['venue']}",
+                        f"Authors: {paper['authors']}\n\n",
+                        f"Link: {paper['link']}",
+                        f"ArXiv Link: {paper['arxiv_link']}",
+                    ]
+                print("\n".join(lines))
+                if verbose and paper["link"] != "Link not available":
+                    paper["downloaded"] = True
+                    paper["file_name"] = f"{sanitize_filename(paper['title'])}.pdf"
+                    papers_to_download.append(paper)
             else:
                 print()
                 print(
@@ -294,6 +680,93 @@ class AutoSearch:
                 f"than {self.score_threshold}"
             )
 
+        self.download_papers(papers_to_download)
+
+    def download_papers(self, papers_info: list[PaperRecord]) -> None:
+        """
+        Download several papers concurrently, falling back to their arXiv link on failure.
+
+        Each paper must have a "file_name"; its "downloaded" entry is set to whether the download
+        succeeded. At most ``download_workers`` papers are downloaded at the same time, and at
+        most a few of them from the same host. Each paper is recorded in a journal as soon as its
+        download completes, and papers recorded as downloaded by an interrupted search are not
+        downloaded again. Papers with the same file name, e.g. a preprint and its published
+        version, are downloaded once, and a paper that fails to download for an unexpected reason
+        does not stop the others.
+
+        Args:
+            papers_info (list[PaperRecord]): The details of the papers to download.
+
+        Example:
+            >>> search = AutoSearch("machine learning")
+            >>> papers = search.search_papers_by_keyword("machine learning")
+            >>> for paper in papers:
+            ...     paper["file_name"] = f"{sanitize_filename(paper['title'])}.pdf"
+            >>> search.download_papers(papers)
+        """
+        os.makedirs(self.destination_folder, exist_ok=True)
+        journal_path = os.path.join(self.destination_folder, _JOURNAL_FILE_NAME)
+        journal_lock = threading.Lock()
+        downloaded_titles = {
+            normalize_title(record["title"])
+            for record in read_journal(journal_path)
+            if record.get("downloaded") and record.get("title")
+        }
+        existing_files: set[str] = set()
+        if downloaded_titles:
+            with os.scandir(self.destination_folder) as entries:
+                existing_files = {entry.name for entry in entries if entry.is_file()}
+
+        def download(paper: PaperRecord) -> bool:
+            if (
+                normalize_title(paper["title"]) in downloaded_titles
+                and paper["file_name"] in existing_files
+            ):
+                print(f"Already downloaded: {paper['file_name']}")
+                return True
+
+            # Probe the link first when there is a fallback, so that links to web pages fail fast
+            # instead of downloading the whole page
+            has_fallback = paper["arxiv_link"] != "Link not available"
+            if has_fallback and is_pdf_link(paper["link"]) is False:
+                print(f"The link does not point to a PDF file: {paper['link']}")
+                downloaded = False
+            else:
+                downloaded = download_pdf(
+                    paper["link"], paper["file_name"], folder=self.destination_folder
+                )
+            if not downloaded:
+                print(f"Trying to download from ArXiv link: {paper['arxiv_link']}")
+                downloaded = download_pdf(
+                    paper["arxiv_link"], paper["file_name"], folder=self.destination_folder
+                )
+            return downloaded
+
+        def download_paper(paper: PaperRecord) -> None:
+            try:
+                paper["downloaded"] = download(paper)
+            except Exception as e:
+                print(f"Failed to download '{paper['title']}': {e}")
+                paper["downloaded"] = False
+            with journal_lock:
+                append_journal_record(journal_path, paper)
+
+        # Papers with the same file name would be written to the same file at the same time, so
+        # only the first of them is downloaded, and the others share its result
+        papers_by_file_name: dict[str, PaperRecord] = {}
+        duplicates: list[tuple[PaperRecord, PaperRecord]] = []
+        for paper in papers_info:
+            first_paper = papers_by_file_name.setdefault(paper["file_name"], paper)
+            if first_paper is not paper:
+                duplicates.append((paper, first_paper))
+
+        with ThreadPoolExecutor(max_workers=max(1, self.download_workers)) as executor:
+            list(executor.map(download_paper, papers_by_file_name.values()))
+
+        for paper, first_paper in duplicates:
+            paper["downloaded"] = first_paper["downloaded"]
+            append_journal_record(journal_path, paper)
+
     def perform_a_search(self, keyword: str) -> None:
         """
         Perform a single search for a given keyword and process the results.
@@ -308,8 +781,9 @@ class AutoSearch:
         papers_info = self.search_papers_by_keyword(keyword)
         self.display_and_download(papers_info)
 
-        # Add search settings to the papers_info list
+        # Add search settings to the metadata of the papers
         current_date = datetime.datetime.now().strftime("%Y-%m-%d")
+        meta_data: list[dict[str, Any]] = [dict(paper_info) for paper_info in papers_info]
         search_settings = {
             "keyword": keyword,
             "num_results": self.num_results,
@@ -319,17 +793,17 @@ class AutoSearch:
             "current_date": current_date,
             "score_threshold": self.score_threshold,
         }
-        papers_info.append(search_settings)
+        meta_data.append(search_settings)
 
         # Save metadata
         os.makedirs(self.destination_folder, exist_ok=True)
         meta_data_path = os.path.join(self.destination_folder, "metadata.json")
-        save_meta_data(meta_data_path, papers_info)  # Use the imported function
+        save_meta_data(meta_data_path, meta_data)  # Use the imported function
 
-        # Zip the folder if required
-        if self.zip_folder:
-            shutil.make_archive(self.destination_folder, "zip", self.destination_folder)
-            print(f"\nFolder saved to {self.destination_folder}.zip")
+        # The metadata now contains all papers of the search, so the journal is no longer needed
+        journal_path = os.path.join(self.destination_folder, _JOURNAL_FILE_NAME)
+        if os.path.exists(journal_path):
+            os.remove(journal_path)
 
     def run(self) -> None:
         """
@@ -359,8 +833,35 @@ class AutoSearch:
             print(f"------Searching for the keyword '{self.keywords}'------")
             self.perform_a_search(self.keywords)
         elif isinstance(self.keywords, list):
-            for idx, keyword in enumerate(self.keywords, start=1):
+            for idx, keyword in enumerate(deduplicate_keywords(self.keywords), start=1):
                 print(f"------Searching for the {idx}th keyword '{keyword}'------")
                 self.perform_a_search(keyword)
         else:
             raise ValueError("keywords must be a string or a list of strings.")
+
+        # Zip the folder once after all searches, if required and if any paper was downloaded
+        if self.zip_folder:
+            if os.path.isdir(self.destination_folder) and self.has_downloaded_papers():
+                archive_path = archive_folder(self.destination_folder)
+                print(f"\nFolder saved to {archive_path}")
+            else:
+                print("\nNo PDFs to archive")
+
+    def has_downloaded_papers(self) -> bool:
+        """
+        Check whether the destination folder contains any downloaded paper.
+
+        The check stops at the first PDF file found, without listing the whole folder.
+
+        Returns:
+            bool: True if the destination folder contains a PDF file, False otherwise.
+
+        Example:
+            >>> search = AutoSearch("machine learning")
+            >>> search.has_downloaded_papers()
+            False
+        """
+        with os.scandir(self.destination_folder) as entries:
+            return any(
+                entry.name.lower().endswith(".pdf") and entry.is_file() for entry in entries
+            )
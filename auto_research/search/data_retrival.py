@@ -1,27 +1,119 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import os
+import tempfile
+import threading
+from typing import Any
 from typing import Optional
+from typing import Sequence
 from typing import Tuple
+from urllib.parse import urlparse
 
 import arxiv
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 from requests.exceptions import Timeout
+from urllib3.util.retry import Retry
 
 from auto_research.search.files_management import is_pdf_uncorrupted
+from auto_research.version import __version__
 
 
-def download_pdf(url: str, filename: str, folder: Optional[str] = None, timeout: int = 10) -> bool:
+try:
+    import orjson
+except ImportError:  # orjson is optional; it only speeds up parsing responses
+    orjson = None  # type: ignore[assignment]
+
+# Transient failures (rate limiting, overloaded servers, dropped connections) are retried with
+# exponential backoff (0.5s, 1s, 2s, ...), honoring the Retry-After header of rate-limited
+# responses. The last response is returned as is, so callers still see its status code. POST
+# is only used for read-only batch lookups, so it is safe to retry as well.
+_RETRY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=("HEAD", "GET", "POST"),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# Shared session, so that consecutive requests to the same host (downloads, Semantic Scholar)
+# reuse pooled connections instead of paying a new TCP and TLS handshake per request. The pool
+# is large enough for the concurrent downloads and detail retrievals of AutoSearch.
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = f"auto_research/{__version__}"
+_SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=_RETRY))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=_RETRY))
+
+# Downloads are streamed to disk in chunks of this size, and abandoned beyond the maximum size
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+_MAX_PDF_SIZE = 200 * 1024 * 1024
+
+# Shared arXiv client, so that its session and connections are reused between lookups. Only one
+# result is needed per lookup, hence a page size of one. The client does not wait between
+# requests, since callers such as AutoSearch rate-limit their lookups themselves; the lock makes
+# its use thread-safe.
+_ARXIV_CLIENT = arxiv.Client(page_size=1, delay_seconds=0.0, num_retries=3)
+_ARXIV_CLIENT_LOCK = threading.Lock()
+
+# Maximum number of papers per request to the batch endpoint of Semantic Scholar
+_SEMANTIC_SCHOLAR_BATCH_SIZE = 500
+
+# Maximum number of concurrent downloads from the same host, to avoid being blocked by it
+_DOWNLOADS_PER_HOST = 4
+_host_semaphores: dict[str, threading.Semaphore] = {}
+_host_semaphores_lock = threading.Lock()
+
+
+def _host_semaphore(url: str) -> threading.Semaphore:
+    host = urlparse(url).netloc
+    with _host_semaphores_lock:
+        return _host_semaphores.setdefault(host, threading.Semaphore(_DOWNLOADS_PER_HOST))
+
+
+def _parse_json(response: requests.Response) -> Any:
+    # Parse the raw bytes with orjson if available, skipping the decoding to text of requests
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def close_session() -> None:
+    """
+    Closes the pooled connections of the shared session used by this module.
+
+    The session remains usable afterwards and opens new connections when needed.
+    """
+    _SESSION.close()
+
+
+def download_pdf(
+    url: str,
+    filename: str,
+    folder: Optional[str] = None,
+    timeout: int = 10,
+    session: Optional[requests.Session] = None,
+) -> bool:
     """
     Downloads a PDF file from the specified URL and saves it to the given filename and folder.
 
+    The file is streamed to a temporary ".part" file, unique to the call, which replaces the
+    target file once the download is complete, so an interrupted download never leaves a
+    truncated PDF behind, and concurrent downloads to the same file name do not interfere.
+    Responses larger than 200 MiB are abandoned. The function is thread-safe. At most a few
+    downloads from the same host run at the same time across all threads, to avoid being blocked
+    by the host.
+
     Args:
         url (str): The URL of the PDF file to download.
         filename (str): The name of the file to save the PDF as.
         folder (Optional[str]): The folder to save the PDF in. If None, saves in the current
         directory.
         timeout (int): The timeout for the request in seconds. Defaults to 10.
+        session (Optional[requests.Session]): The session used for the request. If None, a
+        shared module-level session with connection pooling is used. Defaults to None.
 
     Returns:
         bool: True if the download was successful and the file is not corrupted, False otherwise.
@@ -31,21 +123,42 @@ def download_pdf(url: str, filename: str, folder: Optional[str] = None, timeout:
         Downloaded: sample.pdf
         True
     """
+    # Create the folder if it doesn't exist and construct the file path.
+    if folder is not None:
+        os.makedirs(folder, exist_ok=True)
+        file_path = os.path.join(folder, filename)
+    else:
+        file_path = filename
+    part_path: Optional[str] = None
+
     try:
         print(f"Downloading {filename}... with upper time limit: {timeout} seconds")
-        response = requests.get(url, timeout=timeout)
-        response.raise_for_status()  # Check if the request was successful.
-
-        # Create the folder if it doesn't exist and construct the file path.
-        if folder is not None:
-            os.makedirs(folder, exist_ok=True)
-            file_path = os.path.join(folder, filename)
-        else:
-            file_path = filename
+        with _host_semaphore(url), (session or _SESSION).get(
+            url, timeout=timeout, stream=True
+        ) as response:
+            response.raise_for_status()  # Check if the request was successful.
+            if int(response.headers.get("Content-Length") or 0) > _MAX_PDF_SIZE:
+                print(f"The file '{filename}' is too large to be downloaded.")
+                return False
 
-        # Save the PDF file.
-        with open(file_path, "wb") as f:
-            f.write(response.content)
+            # Save the PDF file.
+            size = 0
+            part_file, part_path = tempfile.mkstemp(
+                prefix=f"{os.path.basename(file_path)}.",
+                suffix=".part",
+                dir=os.path.dirname(file_path) or ".",
+            )
+            with os.fdopen(part_file, "wb") as f:
+                for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > _MAX_PDF_SIZE:
+                        print(f"The file '{filename}' is too large to be downloaded.")
+                        return False
+                    f.write(chunk)
+        # Temporary files are only readable by their owner
+        os.chmod(part_path, 0o644)
+        os.replace(part_path, file_path)
+        part_path = None
         print(f"Downloaded: {filename}.")
 
         # Check if the downloaded PDF file is uncorrupted.
@@ -60,11 +173,105 @@ def download_pdf(url: str, filename: str, folder: Optional[str] = None, timeout:
     except RequestException as e:
         print(f"Failed to download {filename} from {url}: {e}")
         return False
+    except (ValueError, OSError) as e:
+        # E.g. a malformed Content-Length header, or a file that cannot be written or replaced
+        print(f"Failed to download {filename} from {url}: {e}")
+        return False
+    finally:
+        if part_path is not None:
+            try:
+                os.remove(part_path)
+            except OSError:
+                pass
     return True
 
 
+def download_pdfs(
+    downloads: Sequence[Tuple[str, str]],
+    folder: Optional[str] = None,
+    timeout: int = 10,
+    max_workers: int = 8,
+) -> list[bool]:
+    """
+    Downloads several PDF files concurrently.
+
+    Downloading is network-bound, so the files are downloaded by a pool of threads sharing the
+    pooled connections of the module. The total time is therefore close to that of the slowest
+    downloads rather than the sum of all of them.
+
+    Args:
+        downloads (Sequence[Tuple[str, str]]): The URL and file name of each PDF file.
+        folder (Optional[str]): The folder to save the PDF files in. If None, saves in the
+        current directory.
+        timeout (int): The timeout for each request in seconds. Defaults to 10.
+        max_workers (int): The maximum number of concurrent downloads. Defaults to 8.
+
+    Returns:
+        list[bool]: Whether each download was successful, in the order of ``downloads``.
+
+    Example:
+        >>> download_pdfs(
+        ...     [
+        ...         ("https://arxiv.org/pdf/1706.03762", "attention.pdf"),
+        ...         ("https://arxiv.org/pdf/1810.04805", "bert.pdf"),
+        ...     ],
+        ...     folder="pdfs",
+        ... )
+        [True, True]
+    """
+
+    def download(url_and_file_name: Tuple[str, str]) -> bool:
+        url, file_name = url_and_file_name
+        return download_pdf(url, file_name, folder=folder, timeout=timeout)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        return list(executor.map(download, downloads))
+
+
+def is_pdf_link(
+    url: str, timeout: int = 10, session: Optional[requests.Session] = None
+) -> Optional[bool]:
+    """
+    Probes whether a URL points to a PDF file without downloading its content.
+
+    A HEAD request is sent first. If the server does not support it or does not report the
+    content type, the first kilobyte is requested and checked for the PDF signature.
+
+    Args:
+        url (str): The URL to probe.
+        timeout (int): The timeout for each request in seconds. Defaults to 10.
+        session (Optional[requests.Session]): The session used for the requests. If None, a
+        shared module-level session with connection pooling is used. Defaults to None.
+
+    Returns:
+        Optional[bool]: True if the URL points to a PDF file, False if it points to something
+        else (e.g. an HTML page), None if this could not be determined.
+
+    Example:
+        >>> is_pdf_link("https://arxiv.org/pdf/1706.03762")
+        True
+    """
+    session = session or _SESSION
+    try:
+        response = session.head(url, allow_redirects=True, timeout=timeout)
+        content_type = response.headers.get("Content-Type", "").lower()
+        if response.ok and content_type.startswith("application/pdf"):
+            return True
+        if response.ok and content_type.startswith("text/html"):
+            return False
+
+        with session.get(
+            url, headers={"Range": "bytes=0-1023"}, stream=True, timeout=timeout
+        ) as response:
+            if not response.ok:
+                return None
+            return next(response.iter_content(1024), b"").lstrip().startswith(b"%PDF-")
+    except RequestException:
+        return None
+
+
 def get_paper_details_from_semantic_scholar(
-    title: str, verbose: bool = False
+    title: str, verbose: bool = False, session: Optional[requests.Session] = None
 ) -> Optional[Tuple[str, str]]:
     """
     Retrieves paper details (abstract and venue) from Semantic Scholar based on the paper title.
@@ -72,6 +279,8 @@ def get_paper_details_from_semantic_scholar(
     Args:
         title (str): The title of the paper to search for.
         verbose (bool): If True, prints error messages. Defaults to False.
+        session (Optional[requests.Session]): The session used for the request. If None, a
+        shared module-level session with connection pooling is used. Defaults to None.
 
     Returns:
         Optional[Tuple[str, str]]: A tuple containing the abstract and venue of the paper.
@@ -83,10 +292,10 @@ def get_paper_details_from_semantic_scholar(
     """
     url = "https://api.semanticscholar.org/graph/v1/paper/search"
     params = {"query": title, "fields": "title,abstract,venue"}
-    response = requests.get(url, params=params)
+    response = (session or _SESSION).get(url, params=params)
 
     if response.status_code == 200:
-        data = response.json()
+        data = _parse_json(response)
         if data.get("data"):
             paper = data["data"][0]
             abstract = paper.get("abstract", "Abstract not available")
@@ -97,11 +306,106 @@ def get_paper_details_from_semantic_scholar(
     return None
 
 
+def search_semantic_scholar(
+    query: str,
+    limit: int = 100,
+    verbose: bool = False,
+    session: Optional[requests.Session] = None,
+) -> list[dict[str, Any]]:
+    """
+    Searches Semantic Scholar and returns the details of all matching papers with one request.
+
+    Args:
+        query (str): The search query, e.g. a keyword.
+        limit (int): The maximum number of papers to return (at most 100). Defaults to 100.
+        verbose (bool): If True, prints error messages. Defaults to False.
+        session (Optional[requests.Session]): The session used for the request. If None, a
+        shared module-level session with connection pooling is used. Defaults to None.
+
+    Returns:
+        list[dict[str, Any]]: The title, abstract and venue of each matching paper. Returns an
+        empty list if an error occurs.
+
+    Example:
+        >>> papers = search_semantic_scholar("transformers")
+        >>> papers[0]["title"]
+        'Attention is All you Need'
+    """
+    url = "https://api.semanticscholar.org/graph/v1/paper/search"
+    params = {"query": query, "limit": limit, "fields": "title,abstract,venue"}
+    try:
+        response = (session or _SESSION).get(url, params=params, timeout=30)
+    except RequestException as e:
+        if verbose:
+            print(f"Error: {e}")
+        return []
+
+    if response.status_code == 200:
+        return _parse_json(response).get("data") or []
+    if verbose:
+        print(f"Error: {response.status_code}")
+    return []
+
+
+def get_papers_from_semantic_scholar(
+    paper_ids: Sequence[str],
+    verbose: bool = False,
+    session: Optional[requests.Session] = None,
+) -> list[Optional[dict[str, Any]]]:
+    """
+    Retrieves the details of several papers from Semantic Scholar with as few requests as possible.
+
+    The papers are requested from the batch endpoint, up to 500 papers per request.
+
+    Args:
+        paper_ids (Sequence[str]): The identifiers of the papers, in any format supported by
+        Semantic Scholar, e.g. "ARXIV:1706.03762" or "DOI:10.18653/v1/N19-1423".
+        verbose (bool): If True, prints error messages. Defaults to False.
+        session (Optional[requests.Session]): The session used for the requests. If None, a
+        shared module-level session with connection pooling is used. Defaults to None.
+
+    Returns:
+        list[Optional[dict[str, Any]]]: The title, abstract and venue of each paper, in the order
+        of ``paper_ids``. None for the papers that are not found, or whose request fails.
+
+    Example:
+        >>> papers = get_papers_from_semantic_scholar(["ARXIV:1706.03762"])
+        >>> papers[0]["venue"]
+        'Neural Information Processing Systems'
+    """
+    url = "https://api.semanticscholar.org/graph/v1/paper/batch"
+    params = {"fields": "title,abstract,venue"}
+    papers: list[Optional[dict[str, Any]]] = []
+    for start in range(0, len(paper_ids), _SEMANTIC_SCHOLAR_BATCH_SIZE):
+        ids = list(paper_ids[start : start + _SEMANTIC_SCHOLAR_BATCH_SIZE])
+        try:
+            response = (session or _SESSION).post(
+                url, params=params, json={"ids": ids}, timeout=30
+            )
+        except RequestException as e:
+            if verbose:
+                print(f"Error: {e}")
+            papers.extend([None] * len(ids))
+            continue
+
+        if response.status_code == 200:
+            # Papers are returned in the order of the request, and those not found as null
+            papers.extend(paper or None for paper in _parse_json(response))
+        else:
+            if verbose:
+                print(f"Error: {response.status_code}")
+            papers.extend([None] * len(ids))
+    return papers
+
+
 def get_arxiv_paper_details(title: str) -> Optional[Tuple[str, str, str, str]]:
     """
     Retrieves paper details (title, abstract, PDF link, and venue) from arXiv based on the paper
     title.
 
+    Lookups share a single arXiv client and are serialized, and they are not rate-limited:
+    callers sending many lookups should space them out, as the arXiv API asks for.
+
     Args:
         title (str): The title of the paper to search for.
 
@@ -113,13 +417,10 @@ def get_arxiv_paper_details(title: str) -> Optional[Tuple[str, str, str, str]]:
         >>> get_arxiv_paper_details("Attention is All You Need")
         ("Attention is All You Need", "Abstract text...", "http://arxiv.org/pdf/...", "arXiv")
     """
-    client = arxiv.Client()
     search = arxiv.Search(query=title, max_results=1, sort_by=arxiv.SortCriterion.Relevance)
-    results = client.results(search)
-    for result in results:
-        paper_title = result.title
-        abstract = result.summary
-        pdf_link = result.pdf_url
-        venue = result.journal_ref if result.journal_ref else "arXiv"
-        return paper_title, abstract, pdf_link, venue
-    return None
+    with _ARXIV_CLIENT_LOCK:
+        result = next(_ARXIV_CLIENT.results(search), None)
+    if result is None:
+        return None
+    venue = result.journal_ref if result.journal_ref else "arXiv"
+    return result.title, result.summary, result.pdf_url, venue
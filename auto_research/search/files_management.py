@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+import os
+import shutil
+from typing import Optional
+from typing import Sequence
 import warnings
+import zipfile
 
 import fitz
 
 
+# Characters that are not allowed in Windows filenames, mapped to None to delete them
+_ILLEGAL_FILENAME_CHARS = str.maketrans("", "", '<>:"/\\|?*')
+
+
 def sanitize_filename(filename: str) -> str:
     """
     Sanitizes a filename by removing illegal characters that are not allowed in Windows filenames.
@@ -20,15 +29,16 @@ def sanitize_filename(filename: str) -> str:
         >>> sanitize_filename("my/file:name?.txt")
         'myfilename.txt'
     """
-    illegal_chars = ["<", ">", ":", '"', "/", "\\", "|", "?", "*"]
-    for char in illegal_chars:
-        filename = filename.replace(char, "")
-    return filename.strip()
+    return filename.translate(_ILLEGAL_FILENAME_CHARS).strip()
 
 
 def is_pdf_uncorrupted(file_path: str) -> bool:
     """
-    Checks if a PDF file is uncorrupted by attempting to open it using the `fitz` library.
+    Checks if a PDF file is uncorrupted.
+
+    The file is first checked cheaply: it must start with the PDF signature, and it is accepted
+    if it ends with the end-of-file marker. Only files with a signature but no end-of-file marker,
+    e.g. truncated files or files with trailing data, are opened using the `fitz` library.
 
     Args:
         file_path (str): The path to the PDF file to be checked.
@@ -44,9 +54,25 @@ def is_pdf_uncorrupted(file_path: str) -> bool:
         False
 
     Notes:
-        This function uses the `fitz` library (PyMuPDF) to open the PDF file. If the file cannot be
-        opened, it is assumed to be corrupted, and the function returns False.
+        This function uses the `fitz` library (PyMuPDF) to open the PDF file when the cheap check
+        is inconclusive. If the file cannot be opened, it is assumed to be corrupted, and the
+        function returns False.
     """
+    try:
+        with open(file_path, "rb") as f:
+            # The signature may be preceded by a few bytes, which PDF readers tolerate
+            head = f.read(1024)
+            f.seek(max(0, os.fstat(f.fileno()).st_size - 1024))
+            tail = f.read()
+    except OSError as e:
+        warnings.warn(f"Error opening PDF: {e}", UserWarning)
+        return False
+    if b"%PDF-" not in head:
+        warnings.warn(f"Error opening PDF: {file_path} is not a PDF file", UserWarning)
+        return False
+    if b"%%EOF" in tail:
+        return True
+
     try:
         doc = fitz.open(file_path)
         doc.close()
@@ -54,3 +80,109 @@ def is_pdf_uncorrupted(file_path: str) -> bool:
     except Exception as e:
         warnings.warn(f"Error opening PDF: {e}", UserWarning)
         return False
+
+
+def _copy_file(source_path: str, target_path: str) -> None:
+    # Copy the content inside the kernel when possible: copy_file_range can clone the data on
+    # copy-on-write filesystems, and sendfile avoids copying it through user space. Metadata
+    # such as permissions and timestamps is not copied.
+    with open(source_path, "rb") as source, open(target_path, "wb") as target:
+        source_fd, target_fd = source.fileno(), target.fileno()
+        size = os.fstat(source_fd).st_size
+        copied = 0
+        try:
+            if hasattr(os, "copy_file_range"):
+                while copied < size:
+                    sent = os.copy_file_range(source_fd, target_fd, size - copied)
+                    if sent == 0:
+                        break
+                    copied += sent
+            elif hasattr(os, "sendfile"):
+                while copied < size:
+                    sent = os.sendfile(target_fd, source_fd, copied, size - copied)
+                    if sent == 0:
+                        break
+                    copied += sent
+        except OSError:
+            # Not supported between these files, e.g. across filesystems on older kernels
+            pass
+        if copied < size:
+            source.seek(copied)
+            target.seek(copied)
+            shutil.copyfileobj(source, target, 1024 * 1024)
+
+
+def link_or_copy(source_path: str, target_path: str) -> None:
+    """
+    Makes a file available at a new path, hard-linking it when possible and copying it otherwise.
+
+    A hard link is created instantly without copying any data, but requires both paths to be on
+    the same filesystem. Since both paths then refer to the same file, the file must be treated as
+    read-only: modifying it through one path also modifies it through the other. Deleting either
+    path does not affect the other one. If no link can be created, the content of the file is
+    copied inside the kernel when the platform supports it, without its metadata.
+
+    Args:
+        source_path (str): The path of the existing file.
+        target_path (str): The new path of the file. An existing file at this path is replaced.
+
+    Example:
+        >>> link_or_copy("papers/paper.pdf", "papers/top_articles/001_0.9_paper.pdf")
+    """
+    try:
+        os.link(source_path, target_path)
+    except FileExistsError:
+        # The existing file may itself be a hard link, so it is unlinked rather than overwritten,
+        # which would modify every path sharing it
+        os.remove(target_path)
+        link_or_copy(source_path, target_path)
+    except OSError:
+        # Different filesystems, or a filesystem without hard links
+        _copy_file(source_path, target_path)
+
+
+def archive_folder(
+    folder: str, archive_path: Optional[str] = None, exclude: Sequence[str] = ()
+) -> str:
+    """
+    Zips a folder, storing PDF files without compression.
+
+    PDF files are already compressed internally, so deflating them again costs CPU time for
+    almost no reduction in size; all other files are deflated.
+
+    Args:
+        folder (str): The folder to zip.
+        archive_path (Optional[str]): The path of the archive. If None, the archive is saved next
+            to the folder as "<folder>.zip".
+        exclude (Sequence[str]): Subfolders of the folder to leave out of the archive, e.g.
+            folders that are archived separately. Defaults to ().
+
+    Returns:
+        str: The path of the archive.
+
+    Example:
+        >>> archive_folder("papers")
+        'papers.zip'
+    """
+    if archive_path is None:
+        archive_path = f"{os.path.normpath(folder)}.zip"
+    excluded = {os.path.normpath(os.path.abspath(path)) for path in exclude}
+    with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED, allowZip64=True) as archive:
+        for root, dirs, files in os.walk(folder):
+            # Prune the excluded subfolders, so that they are not even walked
+            dirs[:] = [
+                name
+                for name in dirs
+                if os.path.normpath(os.path.abspath(os.path.join(root, name))) not in excluded
+            ]
+            for name in sorted(files):
+                file_path = os.path.join(root, name)
+                compress_type = (
+                    zipfile.ZIP_STORED if name.lower().endswith(".pdf") else zipfile.ZIP_DEFLATED
+                )
+                archive.write(
+                    file_path,
+                    arcname=os.path.relpath(file_path, folder),
+                    compress_type=compress_type,
+                )
+    return archive_path
@@ -1,10 +1,49 @@
 from __future__ import annotations
 
 import datetime
+from functools import lru_cache
+import itertools
 import json
+import math
 import os
 import re
+from typing import Any
+from typing import Mapping
 from typing import Optional
+from typing import Sequence
+from typing import TypedDict
+
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; it only speeds up reading and writing metadata
+    orjson = None  # type: ignore[assignment]
+
+_DAYS_AGO_PATTERN = re.compile(r"(\d+)\s+day[s]?\s+ago")
+_PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
+
+
+class PaperRecord(TypedDict, total=False):
+    """
+    The details of a paper found by a search.
+
+    Records stay plain dictionaries, since they are cached, journaled, saved as metadata and read
+    back by the post-processing tools as JSON. Keys are filled in as a search progresses, e.g.
+    "downloaded" and "file_name" only after a paper is displayed.
+    """
+
+    title: str
+    abstract: str
+    citation_count: int
+    publication_year: int
+    venue: str
+    authors: str
+    link: str
+    arxiv_link: str
+    combined_score: float
+    search_date: str
+    downloaded: bool
+    file_name: str
 
 
 def extract_exact_date(result: dict) -> Optional[datetime.date]:
@@ -26,7 +65,7 @@ def extract_exact_date(result: dict) -> Optional[datetime.date]:
         abstract = result["bib"]["abstract"]
 
         # Extract the number of days ago from the abstract.
-        match = re.search(r"(\d+)\s+day[s]?\s+ago", abstract)
+        match = _DAYS_AGO_PATTERN.search(abstract)
         if match:
             days_ago = int(match.group(1))
             result_datetime = datetime.datetime.now() - datetime.timedelta(days=days_ago)
@@ -36,6 +75,56 @@ def extract_exact_date(result: dict) -> Optional[datetime.date]:
     return None
 
 
+def normalize_title(title: str) -> str:
+    """
+    Normalizes a paper title for comparisons, ignoring letter case, punctuation and whitespace.
+
+    Args:
+        title (str): The title of the paper.
+
+    Returns:
+        str: The lowercased title without punctuation, with surrounding whitespace removed and
+        inner whitespace collapsed to single spaces.
+
+    Example:
+        >>> normalize_title("  BERT: Pre-training of Deep\nBidirectional Transformers. ")
+        'bert pretraining of deep bidirectional transformers'
+    """
+    return " ".join(_PUNCTUATION_PATTERN.sub("", title).lower().split())
+
+
+def _load_json(path: str) -> Any:
+    if orjson is not None:
+        with open(path, "rb") as json_file:
+            return orjson.loads(json_file.read())
+    with open(path, "r") as json_file:
+        return json.load(json_file)
+
+
+def _has_non_finite_float(data: Any) -> bool:
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(map(_has_non_finite_float, data.values()))
+    if isinstance(data, (list, tuple)):
+        return any(map(_has_non_finite_float, data))
+    return False
+
+
+def _dump_json(data: Any, path: str) -> None:
+    # Infinite and NaN values are not valid JSON: orjson would silently save them as null and the
+    # json module as Infinity or NaN, neither of which can be read back as a number by orjson
+    if _has_non_finite_float(data):
+        raise ValueError(f"Cannot save infinite or NaN values to {path}")
+    if orjson is not None:
+        with open(path, "wb") as json_file:
+            json_file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as json_file:
+            json.dump(data, json_file, indent=4)
+
+
+@lru_cache(maxsize=4096)
 def extract_score(file_path: str) -> float:
     """
     Extracts the score from the filename of a PDF file.
@@ -59,13 +148,19 @@ def extract_score(file_path: str) -> float:
         return 0.0  # Default score if extraction fails.
 
 
-def save_meta_data(meta_data_path: str, papers_info: list[dict]) -> None:
+def save_meta_data(meta_data_path: str, papers_info: Sequence[Mapping[str, Any]]) -> None:
     """
     Saves paper metadata to a JSON file, ensuring no duplicate entries based on paper titles.
 
+    Titles are compared with `normalize_title`, and the first entry of each paper is kept.
+
+    If orjson is installed, it is used to read and write the file, which is considerably faster
+    for large metadata files.
+
     Args:
         meta_data_path (str): The file path where the metadata should be saved.
-        papers_info (list[dict]): A list of dictionaries containing paper metadata.
+        papers_info (Sequence[Mapping[str, Any]]): A list of dictionaries containing paper
+            metadata.
 
     Raises:
         ValueError: If either existing data or new data is not a list.
@@ -76,38 +171,47 @@ def save_meta_data(meta_data_path: str, papers_info: list[dict]) -> None:
         Metadata saved to metadata.json
     """
     if os.path.exists(meta_data_path):
-        with open(meta_data_path, "r") as json_file:
-            existing_data = json.load(json_file)
-        if isinstance(existing_data, list) and isinstance(papers_info, list):
-            combined_data = existing_data + papers_info
-        else:
+        existing_data = _load_json(meta_data_path)
+        if not (isinstance(existing_data, list) and isinstance(papers_info, list)):
             raise ValueError("Existing data and new data must be lists.")
     else:
-        combined_data = papers_info
+        existing_data = []
 
-    # Remove duplicates based on paper titles.
+    # Remove duplicates based on paper titles, in a single pass over the existing and new data.
+    # Titles that differ only in letter case, punctuation or whitespace are duplicates.
     seen_titles: set[str] = set()
-    unique_data: list[dict] = []
-    for item in combined_data:
+    unique_data: list[Mapping[str, Any]] = []
+    for item in itertools.chain(existing_data, papers_info):
         title = item.get("title")
         if title:
-            if title not in seen_titles:
+            normalized_title = normalize_title(title)
+            if normalized_title not in seen_titles:
                 unique_data.append(item)
-                seen_titles.add(title)
+                seen_titles.add(normalized_title)
         else:
             unique_data.append(item)
 
     # Save the unique metadata to the file.
-    with open(meta_data_path, "w") as json_file:
-        json.dump(unique_data, json_file, indent=4)
+    _dump_json(unique_data, meta_data_path)
 
     print(f"Metadata saved to {meta_data_path}")
 
 
+@lru_cache(maxsize=32)
+def _read_meta_data_cached(meta_data_path: str, mtime_ns: int, size: int) -> list[dict]:
+    # The modification time and size are part of the key, so that a file modified since it was
+    # cached, e.g. by save_meta_data, is read again
+    return _load_json(meta_data_path)
+
+
 def read_meta_data(meta_data_path: str) -> list[dict]:
     """
     Reads paper metadata from a JSON file.
 
+    The parsed metadata is cached for the lifetime of the process and reused as long as the file
+    is not modified. The returned list is a new list, but its dictionaries are shared between
+    calls and should not be modified.
+
     Args:
         meta_data_path (str): The file path from which to read the metadata.
 
@@ -119,9 +223,53 @@ def read_meta_data(meta_data_path: str) -> list[dict]:
         >>> read_meta_data("metadata.json")
         [{"title": "Paper 1", "abstract": "..."}]
     """
-    if os.path.exists(meta_data_path):
-        with open(meta_data_path, "r") as json_file:
-            meta_data = json.load(json_file)
-        return meta_data
-    else:
+    try:
+        stat = os.stat(meta_data_path)
+    except FileNotFoundError:
+        return []
+    return list(_read_meta_data_cached(meta_data_path, stat.st_mtime_ns, stat.st_size))
+
+
+def append_journal_record(journal_path: str, record: Mapping[str, Any]) -> None:
+    """
+    Appends a record to a JSON-Lines journal file and flushes it to disk.
+
+    Args:
+        journal_path (str): The file path of the journal.
+        record (Mapping[str, Any]): The record to append.
+
+    Example:
+        >>> append_journal_record("metadata.jsonl", {"title": "Paper 1", "downloaded": True})
+    """
+    with open(journal_path, "a") as journal_file:
+        journal_file.write(json.dumps(record) + "\n")
+        journal_file.flush()
+
+
+def read_journal(journal_path: str) -> list[dict]:
+    """
+    Reads the records of a JSON-Lines journal file.
+
+    Lines that cannot be decoded, e.g. a record partially written when the process was killed,
+    are skipped.
+
+    Args:
+        journal_path (str): The file path of the journal.
+
+    Returns:
+        list[dict]: The records of the journal. Returns an empty list if the file does not exist.
+
+    Example:
+        >>> read_journal("metadata.jsonl")
+        [{"title": "Paper 1", "downloaded": True}]
+    """
+    if not os.path.exists(journal_path):
         return []
+    records = []
+    with open(journal_path, "r") as journal_file:
+        for line in journal_file:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return records
@@ -1,3 +1,4 @@
+from typing import Dict
 from typing import List
 
 from LLM_utils.inquiry import extract_code
@@ -70,6 +71,32 @@ def test_as_list(raw_response: str) -> List[str]:
     return extraction
 
 
+def deduplicate_keywords(keywords: List[str]) -> List[str]:
+    """
+    Removes duplicate and empty keywords while preserving their order.
+
+    Keywords that differ only in letter case or surrounding and repeated whitespace are
+    considered duplicates; the first occurrence is kept.
+
+    Args:
+        keywords (list): The keywords to deduplicate.
+
+    Returns:
+        list: The stripped, unique keywords in their original order.
+
+    Example:
+        >>> deduplicate_keywords(["Deep learning", " deep  learning ", "", "RL"])
+        ['Deep learning', 'RL']
+    """
+    unique_keywords: Dict[str, str] = {}
+    for keyword in keywords:
+        stripped_keyword = keyword.strip()
+        if stripped_keyword:
+            normalized_keyword = " ".join(stripped_keyword.lower().split())
+            unique_keywords.setdefault(normalized_keyword, stripped_keyword)
+    return list(unique_keywords.values())
+
+
 def suggest_keywords(user_prompt: str, model: str, api_key: str) -> List[str]:
     """
     Generates a list of related keywords for a given research topic using the OpenAI model.
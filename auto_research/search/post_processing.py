@@ -1,14 +1,37 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+import heapq
+from itertools import takewhile
+from operator import itemgetter
 import os
 import shutil
+from typing import Optional
 
-import matplotlib.pyplot as plt
+import matplotlib
+from matplotlib.figure import Figure
+import numpy as np
 
+from auto_research.search.files_management import archive_folder
+from auto_research.search.files_management import link_or_copy
 from auto_research.search.files_management import sanitize_filename
+from auto_research.search.information import normalize_title
 from auto_research.search.information import read_meta_data
 
 
+# Number of threads copying papers to the target folder
+_COPY_WORKERS = 8
+
+# Above this number of papers, the score line is drawn without a marker per paper
+_MAX_LINE_MARKERS = 2000
+
+# Resolution of the saved plots; they are only informational, so a low resolution is enough
+_PLOT_DPI = 72
+
+# Number of vertices after which Agg strokes a path in chunks, which keeps long score lines fast
+_PATH_CHUNK_SIZE = 10000
+
+
 class ArticleOrganizer:
     """
     A class to organize, filter, and visualize academic papers based on their combined scores.
@@ -16,6 +39,10 @@ class ArticleOrganizer:
     This class provides functionality to filter papers by score or rank, organize files
     into a target folder, and visualize the distribution of paper scores.
 
+    Organized files are hard links to the papers in the source folder whenever both folders are
+    on the same filesystem, so no data is copied. A paper must then not be modified in place
+    after organizing, since the change would show in both folders.
+
     Attributes:
         source_folder (str): The folder where the original papers and metadata are stored.
         target_folder (str): The folder where organized papers will be saved.
@@ -91,53 +118,83 @@ class ArticleOrganizer:
         if not os.path.exists(self.target_folder):
             os.makedirs(self.target_folder)
 
-    def draw(self, paper_list: list[dict], title: str) -> None:
+    def draw(
+        self, paper_list: list[dict], title: str, scores: Optional[np.ndarray] = None
+    ) -> None:
         """
         Plot the combined scores of papers and save the plot as an image.
 
         Args:
             paper_list (list[dict]): A list of dictionaries containing paper details.
             title (str): The title of the plot.
+            scores (Optional[np.ndarray]): The combined scores of the papers in paper_list, if
+                they are already available as an array. Defaults to None (read from paper_list).
 
         Example:
             >>> organizer = ArticleOrganizer("papers")
             >>> papers = [{"title": "Paper 1", "combined_score": 0.9, "downloaded": True}]
             >>> organizer.draw(papers, "Test Plot")
         """
-        boolean_list = [paper.get("downloaded", False) for paper in paper_list]
-        x_values = list(range(1, len(paper_list) + 1))
-        y_values = [paper["combined_score"] for paper in paper_list]
-
-        # Create the plot
-        plt.figure(figsize=(10, 6))
-        plt.plot(x_values, y_values, marker="o", linestyle="-", color="black")
-
-        # Highlight downloaded papers in green
-        for i, is_true in enumerate(boolean_list):
-            if is_true:
-                plt.plot(
-                    x_values[i],
-                    y_values[i],
-                    marker="o",
-                    linestyle="None",
-                    color="green",
-                    label="downloaded",
-                )
+        downloaded = np.fromiter(
+            (paper.get("downloaded", False) for paper in paper_list),
+            dtype=bool,
+            count=len(paper_list),
+        )
+        x_values = np.arange(1, len(paper_list) + 1)
+        if scores is not None:
+            y_values = scores
+        else:
+            y_values = np.fromiter(
+                (paper["combined_score"] for paper in paper_list),
+                dtype=np.float64,
+                count=len(paper_list),
+            )
+
+        # Create the figure without pyplot, so that it is not registered in the global state of
+        # pyplot and does not need a GUI backend; it is freed once it goes out of scope
+        fig = Figure(figsize=(10, 6))
+        ax = fig.subplots()
+
+        # Create the plot. The data artists are rasterized, which keeps vector output small and
+        # fast to render when there are many papers, while the axes and labels stay vectorized.
+        # Markers would overlap anyway for large catalogs, so the line is then drawn alone, which
+        # lets matplotlib simplify it.
+        ax.plot(
+            x_values,
+            y_values,
+            marker="o" if len(paper_list) <= _MAX_LINE_MARKERS else None,
+            linestyle="-",
+            color="black",
+            rasterized=True,
+        )
+
+        # Highlight downloaded papers in green, with a single artist for all of them
+        if downloaded.any():
+            ax.scatter(
+                x_values[downloaded],
+                y_values[downloaded],
+                marker="o",
+                color="green",
+                label="downloaded",
+                zorder=3,
+                rasterized=True,
+            )
 
         # Set plot labels and title
-        plt.xlabel("Rank")
-        plt.ylabel("Combined Score")
-        plt.title(title)
-        plt.yscale("log")  # Set y-axis to logarithmic scale
-        plt.grid(True)
-
-        # Handle legend to avoid duplicate labels
-        handles, labels = plt.gca().get_legend_handles_labels()
-        by_label = dict(zip(labels, handles))
-        plt.legend(by_label.values(), by_label.keys())
-
-        # Save the plot as an image
-        plt.savefig(f"{self.target_folder}/{title}.png")
+        ax.set_xlabel("Rank")
+        ax.set_ylabel("Combined Score")
+        ax.set_title(title)
+        ax.set_yscale("log")  # Set y-axis to logarithmic scale
+        ax.grid(True)
+
+        # All downloaded papers share a single artist, hence a single legend entry
+        if downloaded.any():
+            ax.legend()
+
+        # Save the plot as an image. The figure is rendered when it is saved, so the chunk size
+        # only needs to be set here, without changing the global settings of matplotlib.
+        with matplotlib.rc_context({"agg.path.chunksize": _PATH_CHUNK_SIZE}):
+            fig.savefig(f"{self.target_folder}/{title}.png", dpi=_PLOT_DPI, bbox_inches="tight")
         print(f"Plot of score vs rank saved to {self.target_folder}/{title}.png")
 
     def organize_and_visualize(self) -> None:
@@ -150,7 +207,8 @@ class ArticleOrganizer:
         3. Draw a plot of the unfiltered papers if plotting is True.
         4. Filter papers based on the selected threshold type ("rank" or "score").
         5. Draw a plot of the filtered papers if plotting is True.
-        6. Organize files into the target folder if required, preventing duplicates.
+        6. Organize files into the target folder if required, preventing duplicates. Files are
+           hard-linked rather than copied when possible, so they should not be modified.
         7. Zip the target folder and source folder if required.
 
         Example:
@@ -161,42 +219,59 @@ class ArticleOrganizer:
         meta_data_path = os.path.join(self.source_folder, "metadata.json")
         meta_data = read_meta_data(meta_data_path)
 
-        # Sort papers by combined score in descending order and remove duplicates
-        original_list = sorted(
-            [paper for paper in meta_data if "combined_score" in paper],
-            key=lambda x: x["combined_score"],
-            reverse=True,
-        )
-
-        # Remove duplicates based on title while keeping the highest scoring version
-        seen_titles: dict[str, dict] = {}
-        unique_list = []
-        for paper in original_list:
-            title = paper.get("title", "").strip()
-            if title and (
-                title not in seen_titles
-                or paper["combined_score"] > seen_titles[title]["combined_score"]
+        # Remove duplicates based on title while keeping the highest scoring version, then sort
+        # the remaining papers by combined score in descending order. Titles that differ only in
+        # letter case, punctuation or whitespace are duplicates.
+        best_papers: dict[str, dict] = {}
+        for paper in meta_data:
+            title = normalize_title(paper.get("title", ""))
+            if (
+                title
+                and "combined_score" in paper
+                and (
+                    title not in best_papers
+                    or paper["combined_score"] > best_papers[title]["combined_score"]
+                )
             ):
-                seen_titles[title] = paper
-                unique_list.append(paper)
-
-        original_list = unique_list
-
-        # Draw the unfiltered plot if plotting is True
-        if self.plotting:
-            self.draw(original_list, "Unfiltered")
-
-        # Filter papers based on the selected method
-        if self.threshold_type == "score":
-            filtered_list = [
-                paper for paper in original_list if paper["combined_score"] > self.score_threshold
-            ]
-        else:  # "rank"
-            filtered_list = original_list[: self.rank_threshold]
+                best_papers[title] = paper
+
+        if self.threshold_type != "score" and not self.plotting:
+            # Only the top papers are needed, so they are selected without sorting all papers
+            filtered_list = heapq.nlargest(
+                self.rank_threshold, best_papers.values(), key=itemgetter("combined_score")
+            )
+        else:
+            # Sort with NumPy on an array of the scores rather than comparing dictionaries
+            papers = list(best_papers.values())
+            scores = np.fromiter(
+                (paper["combined_score"] for paper in papers),
+                dtype=np.float64,
+                count=len(papers),
+            )
+            order = np.argsort(-scores, kind="stable")
+            original_list = [papers[idx] for idx in order]
+            sorted_scores = scores[order]
+
+            # Draw the unfiltered plot if plotting is True
+            if self.plotting:
+                self.draw(original_list, "Unfiltered", sorted_scores)
+
+            # Filter papers based on the selected method. The papers are sorted by descending
+            # score, so those above the threshold form a prefix and the rest is never visited.
+            if self.threshold_type == "score":
+                score_threshold = self.score_threshold
+                filtered_list = list(
+                    takewhile(
+                        lambda paper: paper["combined_score"] > score_threshold, original_list
+                    )
+                )
+            else:  # "rank"
+                filtered_list = original_list[: self.rank_threshold]
 
-        # Draw the filtered plot if plotting is True
-        if self.plotting:
-            self.draw(filtered_list, "Filtered")
+            # Draw the filtered plot if plotting is True. Both filters keep a prefix of the
+            # sorted papers, so their scores are a prefix of the sorted scores.
+            if self.plotting:
+                self.draw(filtered_list, "Filtered", sorted_scores[: len(filtered_list)])
 
         # Organize files if required
         if self.organize_files:
@@ -205,36 +280,64 @@ class ArticleOrganizer:
                 shutil.rmtree(self.target_folder)
             os.makedirs(self.target_folder)
 
-            # Process each paper
+            # List the source folder once instead of checking each file
+            with os.scandir(self.source_folder) as entries:
+                source_files = {entry.name for entry in entries if entry.is_file()}
+
+            # Process each paper; the files are copied concurrently once all are known
+            source_folder = self.source_folder
+            target_folder = self.target_folder
+            order_by_score = self.order_by_score
             processed_files = set()  # Track processed files to avoid duplicates
+            copies: list[tuple[str, str]] = []
             for idx, paper in enumerate(filtered_list):
                 try:
-                    title = paper["title"]
-                    score = paper["combined_score"]
-                    downloaded = paper.get("downloaded", False)
-                    if downloaded:
-                        sanitized_title = sanitize_filename(title)
-                        base_filename = f"{sanitized_title}.pdf"
-
-                        # Check if this file has already been processed
-                        if base_filename in processed_files:
-                            continue
+                    if paper.get("downloaded", False):
+                        base_filename = f"{sanitize_filename(paper['title'])}.pdf"
 
-                        source_path = os.path.join(self.source_folder, base_filename)
-                        if not os.path.exists(source_path):
+                        # Skip files already processed or missing from the source folder
+                        if base_filename in processed_files or base_filename not in source_files:
                             continue
 
                         # Create new filename with consistent ranking
-                        if self.order_by_score:
+                        if order_by_score:
                             rank = str(idx + 1).zfill(3)  # Use 3 digits for ranking
-                            new_filename = f"{rank}_{score:.3g}_{base_filename}"
+                            new_filename = f"{rank}_{paper['combined_score']:.3g}_{base_filename}"
                         else:
                             new_filename = base_filename
 
-                        # Copy file and mark as processed
-                        shutil.copy(source_path, os.path.join(self.target_folder, new_filename))
+                        # Queue the copy and mark as processed
+                        copies.append(
+                            (
+                                os.path.join(source_folder, base_filename),
+                                os.path.join(target_folder, new_filename),
+                            )
+                        )
                         processed_files.add(base_filename)
 
                 except Exception as e:
                     print(f"Error organizing file: {e}")
                     continue
+
+            def copy(paths: tuple[str, str]) -> None:
+                try:
+                    link_or_copy(*paths)
+                except Exception as e:
+                    print(f"Error organizing file: {e}")
+
+            # The target folder is inside the source folder, so the files are usually hard-linked
+            # rather than copied. Copying is I/O-bound and releases the GIL, so the files are
+            # linked or copied by threads.
+            if copies:
+                with ThreadPoolExecutor(max_workers=min(_COPY_WORKERS, len(copies))) as executor:
+                    list(executor.map(copy, copies))
+
+        # Zip the folders if required. The target folder is inside the source folder, but it is
+        # archived separately and only contains papers of the source folder, so it is left out of
+        # the archive of the source folder. The source folder is zipped first, so that its
+        # archive does not contain the archive of the target folder either.
+        if self.zip_folder:
+            archive_path = archive_folder(self.source_folder, exclude=[self.target_folder])
+            print(f"Folder saved to {archive_path}")
+            archive_path = archive_folder(self.target_folder)
+            print(f"Folder saved to {archive_path}")
@@ -1,15 +1,178 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+import json
+import logging
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+from typing import Any
 from typing import Callable
+from typing import Collection
 from typing import Optional
+from typing import TypeVar
 
 from LLM_utils.inquiry import OpenAI_interface
+import openai
 
+from auto_research.survey.paper_reader import DEFAULT_TEXT_CACHE_FOLDER
 from auto_research.survey.paper_reader import Paper
 from auto_research.survey.prompts import SurveyPrompt
+from auto_research.utils.cache import ResponseCache
 from auto_research.utils.stored_info import Storage
 
 
+# Progress messages are logged rather than printed, so that they can be silenced or redirected,
+# e.g. when many papers are processed concurrently; results are still printed
+logger = logging.getLogger(__name__)
+
+# Maximum number of inquiries in flight at the same time in the process, however many instances
+# and threads send them, so that concurrent surveys stay within the rate limits of the API
+_MAX_CONCURRENT_INQUIRIES = 8
+_INQUIRY_SEMAPHORE = threading.BoundedSemaphore(_MAX_CONCURRENT_INQUIRIES)
+
+# Retries of an inquiry rejected by the rate limit, waiting a random time up to an exponentially
+# growing bound (in seconds) between attempts, so that rejected threads do not retry in lockstep
+_RATE_LIMIT_RETRIES = 5
+_RATE_LIMIT_BACKOFF = 1.0
+_RATE_LIMIT_MAX_BACKOFF = 30.0
+
+# Below this number of papers, the key sections are extracted with regular inquiries, since a job
+# of the Batch API may take much longer to complete than the inquiries themselves
+_MIN_BATCH_API_PAPERS = 10
+_BATCH_API_FINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+_T = TypeVar("_T")
+
+
+def _call_api(call: Callable[[], _T]) -> _T:
+    """
+    Call the API within the limit of concurrent inquiries, retrying if the rate limit is hit.
+
+    Args:
+        call (Callable[[], _T]): The function sending the inquiry.
+
+    Returns:
+        _T: The result of the call.
+    """
+    for attempt in range(_RATE_LIMIT_RETRIES):
+        try:
+            with _INQUIRY_SEMAPHORE:
+                return call()
+        except openai.RateLimitError:
+            time.sleep(
+                random.uniform(0, min(_RATE_LIMIT_MAX_BACKOFF, _RATE_LIMIT_BACKOFF * 2**attempt))
+            )
+    with _INQUIRY_SEMAPHORE:
+        return call()
+
+
+def _send_inquiry(
+    OpenAI_instance: OpenAI_interface,
+    model: str,
+    prompt: Any,
+    tests: Optional[Callable] = None,
+    response_cache: Optional[ResponseCache] = None,
+) -> tuple[str, float]:
+    """
+    Send a prompt to the GPT model, answering it from the response cache when possible.
+
+    At most ``_MAX_CONCURRENT_INQUIRIES`` inquiries are sent at the same time, and inquiries
+    rejected by the rate limit of the API are retried with randomized exponential backoff.
+
+    Args:
+        OpenAI_instance (OpenAI_interface): The GPT handler used for the inquiry.
+        model (str): The GPT model identifier, used as part of the cache key.
+        prompt (Any): The formatted prompt.
+        tests (Optional[Callable]): A callable function for testing the response sequence.
+        response_cache (Optional[ResponseCache]): Persistent cache of LLM responses.
+
+    Returns:
+        tuple[str, float]: The response and the cost of the inquiry (0 for a cache hit).
+    """
+    if response_cache is not None:
+        cache_key = ResponseCache.make_key(model, json.dumps(prompt, sort_keys=True, default=str))
+        cached_response = response_cache.get(cache_key)
+        if cached_response is not None:
+            return cached_response, 0
+
+    if tests:
+        response, cost = _call_api(lambda: OpenAI_instance.ask_with_test(prompt, tests))
+    else:
+        response, cost = _call_api(lambda: OpenAI_instance.ask(prompt))
+
+    if response_cache is not None and response:
+        response_cache.put(cache_key, response)
+    return response, cost
+
+
+def _stream_inquiry(
+    client: openai.OpenAI,
+    model: str,
+    prompt: Any,
+    response_cache: Optional[ResponseCache] = None,
+) -> str:
+    """
+    Send a prompt to the GPT model and print the response while it is generated.
+
+    The response cache, the limit of concurrent inquiries and the retries work as in
+    ``_send_inquiry``. The cost of a streamed inquiry is not known, so it is not returned.
+
+    Args:
+        client (openai.OpenAI): The OpenAI client used for the inquiry.
+        model (str): The GPT model identifier.
+        prompt (Any): The formatted prompt, a list of chat messages.
+        response_cache (Optional[ResponseCache]): Persistent cache of LLM responses.
+
+    Returns:
+        str: The whole response.
+    """
+    if response_cache is not None:
+        cache_key = ResponseCache.make_key(model, json.dumps(prompt, sort_keys=True, default=str))
+        cached_response = response_cache.get(cache_key)
+        if cached_response is not None:
+            print(cached_response)
+            return cached_response
+
+    def stream() -> str:
+        chunks = []
+        for chunk in client.chat.completions.create(model=model, messages=prompt, stream=True):
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                print(delta, end="", flush=True)
+                chunks.append(delta)
+        print()
+        return "".join(chunks)
+
+    response = _call_api(stream)
+    if response_cache is not None and response:
+        response_cache.put(cache_key, response)
+    return response
+
+
+def default_response_cache(storage_path: str) -> ResponseCache:
+    """
+    Return the response cache stored next to the given storage file.
+
+    The entries never expire, since the response to a prompt does not depend on when the prompt
+    is sent, so rerunning the same papers later costs nothing.
+
+    Args:
+        storage_path (str): Path to the storage file for saving extracted information.
+
+    Returns:
+        ResponseCache: The cache, in ``<storage file name without extension>_llm_cache.sqlite``.
+
+    Example:
+        >>> default_response_cache("papers/summaries.json").path
+        'papers/summaries_llm_cache.sqlite'
+    """
+    return ResponseCache(f"{os.path.splitext(storage_path)[0]}_llm_cache.sqlite", ttl=None)
+
+
 class AutoSurvey:
     """
     A class for automating the process of surveying research papers.
@@ -29,9 +192,30 @@ class AutoSurvey:
             Defaults to "load".
         storage_path (str, optional): Path to the storage file for saving extracted information.
             Defaults to "papers.json".
+        response_cache (ResponseCache, optional): Persistent cache of LLM responses. Identical
+            prompts sent to the same model are answered from the cache without an API call.
+            Defaults to None (no caching).
+        cache_responses (bool, optional): If True and no response_cache is given, the responses
+            are cached next to the storage file, see :func:`default_response_cache`. Defaults to
+            False.
+        text_cache_folder (str, optional): Folder for caching the text extracted from the PDF
+            file, so that the file is parsed only once. If None, the text is not cached. Defaults
+            to ``~/.auto_research/pdf_cache``.
+        OpenAI_instance (OpenAI_interface, optional): An existing GPT handler to reuse, e.g. one
+            shared by the instances created for several papers, so that its client and
+            connections are set up only once. If None, a new handler is created from api_key,
+            model and debug. Defaults to None.
+        stream (bool, optional): If True, the summary and the explanations are printed while
+            they are generated, instead of once they are complete. Their cost is then not
+            included in cost_accumulation. Defaults to False.
+        paper_instance (Paper, optional): An existing Paper instance of paper_path to reuse, e.g.
+            one shared by several instances analyzing the same paper with different settings, so
+            that the PDF file is read only once. If None, a new instance is created. Defaults to
+            None.
 
     Attributes:
         OpenAI_instance (OpenAI_interface): Instance of GPT handler for text processing.
+        model (str): The GPT model identifier.
         paper_path (str): Path to the research paper being analyzed.
         paper_name (str): Name of the research paper file.
         paper_instance (Paper): Instance of Paper class for PDF processing.
@@ -40,8 +224,11 @@ class AutoSurvey:
         approach (str): Current extraction approach.
         output (Optional[str]): Storage for analysis results.
         ending_pages (Optional[str]): Content of the paper's final pages.
+        extracted_information (dict[str, str]): The sections extracted from the paper by this
+            instance.
         storage_instance (Storage): Instance for storing and retrieving extracted information.
         cost_accumulation (float): Accumulated cost of API usage.
+        response_cache (Optional[ResponseCache]): Persistent cache of LLM responses.
 
     Example:
         >>> survey = AutoSurvey(
@@ -50,6 +237,12 @@ class AutoSurvey:
         >>> survey.run()
     """
 
+    _KEY_SECTIONS: tuple[str, ...] = ("abstract", "introduction", "discussion", "conclusion")
+    # Raw text shorter than this (ignoring surrounding whitespace), e.g. from a scanned PDF file
+    # without a text layer or from a title page, cannot contain a section and is not sent
+    _MIN_TEXT_LENGTH = 200
+    _JSON_OBJECT_PATTERN = re.compile(r"\{.*\}", re.DOTALL)
+
     def __init__(
         self,
         api_key: str,
@@ -59,19 +252,36 @@ class AutoSurvey:
         mode: str = "summarize_computer_science",
         approach: str = "load",
         storage_path: str = "papers.json",
+        response_cache: Optional[ResponseCache] = None,
+        cache_responses: bool = False,
+        text_cache_folder: Optional[str] = DEFAULT_TEXT_CACHE_FOLDER,
+        OpenAI_instance: Optional[OpenAI_interface] = None,
+        stream: bool = False,
+        paper_instance: Optional[Paper] = None,
     ) -> None:
 
-        self.OpenAI_instance = OpenAI_interface(api_key, model=model, debug=debug)
+        self.OpenAI_instance = (
+            OpenAI_instance
+            if OpenAI_instance is not None
+            else OpenAI_interface(api_key, model=model, debug=debug)
+        )
+        self.model = model
         self.paper_path = paper_path
         self.paper_name = paper_path.split("/")[-1]
-        self.paper_instance = Paper(paper_path, model=model)
-        self.paper_instance.read_pymupdf()
+        # The PDF file is only read when its text is first needed
+        self.paper_instance = (
+            paper_instance
+            if paper_instance is not None
+            else Paper(paper_path, model=model, text_cache_folder=text_cache_folder)
+        )
         self.prompt_instance = SurveyPrompt()
         self.mode = mode
         self.approach = approach
         self.output: Optional[str] = None
         self.ending_pages: Optional[str] = None
-        self.paper_instance.extracted_information = {
+        # The sections are kept by this instance rather than by the Paper instance, which may be
+        # shared by several instances analyzing the same paper, possibly concurrently
+        self.extracted_information: dict[str, str] = {
             "abstract": "",
             "introduction": "",
             "discussion": "",
@@ -79,10 +289,42 @@ class AutoSurvey:
             "algorithm": "",
         }
         self.storage_instance = Storage(storage_path)
-        self.cost_accumulation = 0
+        self.cost_accumulation: float = 0.0
+        if response_cache is None and cache_responses:
+            response_cache = default_response_cache(storage_path)
+        self.response_cache = response_cache
+        self.stream = stream
+        self._client: Optional[openai.OpenAI] = openai.OpenAI(api_key=api_key) if stream else None
+
+    @classmethod
+    def from_paper(cls, paper: Paper, api_key: str, model: str, **kwargs: Any) -> AutoSurvey:
+        """
+        Create an instance analyzing an existing Paper instance, reusing the text already read.
+
+        Args:
+            paper (Paper): The paper to analyze.
+            api_key (str): The API key for GPT model access.
+            model (str): The GPT model identifier to use.
+            **kwargs (Any): The other arguments of :class:`AutoSurvey`.
+
+        Returns:
+            AutoSurvey: The new instance.
+
+        Example:
+            >>> paper = Paper("path/to/paper.pdf")
+            >>> paper.read_pymupdf()
+            >>> surveys = [
+            ...     AutoSurvey.from_paper(paper, "your-api-key", model)
+            ...     for model in ["gpt-4o-mini", "gpt-4o"]
+            ... ]
+        """
+        return cls(api_key, model, paper.paper_path, paper_instance=paper, **kwargs)
 
     def run(
-        self, target_information: Optional[str] = None, tests: Optional[Callable] = None
+        self,
+        target_information: Optional[str] = None,
+        tests: Optional[Callable] = None,
+        questions: Optional[list[str]] = None,
     ) -> None:
         """
         Execute the paper analysis based on the selected mode.
@@ -91,34 +333,39 @@ class AutoSurvey:
             target_information (Optional[str]): Specific information to retrieve when mode is
             "information_retrieval".
         tests (Optional[Callable]): A callable function for testing the response sequence.
+        questions (Optional[list[str]]): Questions to answer when mode is
+            "explain_computer_science". If None, the questions are asked interactively.
 
         Example:
             >>> survey = AutoSurvey(api_key, model, paper_path)
             >>> survey.run()
         """
-        if self.mode == "summarize_computer_science":
-            print(f"Begin analyzing the article located at {self.paper_path}")
-            self.extraction()
-            self.summarize_computer_science()
-            print("The summary is:")
-            print()
-            print(self.output)
-        elif self.mode == "explain_computer_science":
-            print(f"Begin analyzing the article located at {self.paper_path}")
-            self.extraction()
-            self.explain_computer_science()
-        elif self.mode == "explain_algorithm":
-            self.extract_algorithm()
-            self.explain_algorithm()
-        elif self.mode == "information_retrieval":
-            if target_information is None:
-                raise ValueError(
-                    "target_information cannot be None when mode is 'information_retrieval'"
-                )
-            self.information_retrieval(target_information, tests)
-            print("The retrieved information is:")
-            print()
-            print(self.output)
+        # The storage file is written once, after all the information of the paper is extracted
+        with self.storage_instance.deferred_saves():
+            if self.mode == "summarize_computer_science":
+                logger.info("Begin analyzing the article located at %s", self.paper_path)
+                self.extraction()
+                self.summarize_computer_science()
+                if not self.stream:
+                    print("The summary is:")
+                    print()
+                    print(self.output)
+            elif self.mode == "explain_computer_science":
+                logger.info("Begin analyzing the article located at %s", self.paper_path)
+                self.extraction()
+                self.explain_computer_science(questions)
+            elif self.mode == "explain_algorithm":
+                self.extract_algorithm()
+                self.explain_algorithm()
+            elif self.mode == "information_retrieval":
+                if target_information is None:
+                    raise ValueError(
+                        "target_information cannot be None when mode is 'information_retrieval'"
+                    )
+                self.information_retrieval(target_information, tests)
+                print("The retrieved information is:")
+                print()
+                print(self.output)
 
         print(f"The total cost is {self.cost_accumulation} USD")
 
@@ -126,19 +373,42 @@ class AutoSurvey:
         """
         Send an inquiry to the GPT model.
 
+        If a response cache is configured, a response previously obtained for the same model and
+        prompt is returned without calling the API, and no cost is accumulated.
+
         Args:
             tests (Optional[Callable]): A callable function for testing the response sequence.
 
         Returns:
             str: The response from the GPT model.
         """
-        if tests:
-            response, cost = self.OpenAI_instance.ask_with_test(self.prompt_instance.prompt, tests)
-        else:
-            response, cost = self.OpenAI_instance.ask(self.prompt_instance.prompt)
+        response, cost = _send_inquiry(
+            self.OpenAI_instance,
+            self.model,
+            self.prompt_instance.prompt,
+            tests,
+            self.response_cache,
+        )
         self.cost_accumulation += cost
         return response
 
+    def send_inquiry_and_print(self) -> str:
+        """
+        Send an inquiry to the GPT model and print the response.
+
+        If streaming is enabled, the response is printed while it is generated.
+
+        Returns:
+            str: The response from the GPT model.
+        """
+        if self._client is not None:
+            return _stream_inquiry(
+                self._client, self.model, self.prompt_instance.prompt, self.response_cache
+            )
+        response = self.send_inquiry()
+        print(response)
+        return response
+
     def information_retrieval(
         self, target_information: str, tests: Optional[Callable] = None
     ) -> None:
@@ -172,11 +442,14 @@ class AutoSurvey:
             >>> survey.extract_algorithm()
         """
         raw_text = self.paper_instance.first_n_pages(12)
+        if not self._has_text(raw_text):
+            logger.warning("Not enough text extracted from the paper to extract the algorithm.")
+            return
         self.prompt_instance.extract_algorithm(raw_text)
         response = self.send_inquiry()
         print(response)
         if response:
-            self.paper_instance.extracted_information["algorithm"] = response
+            self.extracted_information["algorithm"] = response
 
     def explain_algorithm(self) -> None:
         """
@@ -188,9 +461,9 @@ class AutoSurvey:
         """
         self.prompt_instance.explain_algorithm(
             self.paper_instance.first_n_pages(12),
-            self.paper_instance.extracted_information["algorithm"],
+            self.extracted_information["algorithm"],
         )
-        print(self.OpenAI_instance.ask(self.prompt_instance.prompt))
+        self.output = self.send_inquiry_and_print()
 
     def review(self) -> None:
         """Review the paper content (placeholder for future implementation)."""
@@ -198,15 +471,127 @@ class AutoSurvey:
 
     def extraction_key_information(self) -> None:
         """Extract key information from the paper, including abstract, introduction, discussion,
-        and conclusion."""
-        print("Extracting from paper.")
-        self.extract_abstract()
-        self.extract_introduction()
+        and conclusion.
+
+        All sections are extracted with a single inquiry, so the paper text is sent only once.
+        Sections missing from the response are extracted with their own inquiries, which are sent
+        concurrently."""
+        logger.info("Extracting from paper.")
         ending_pages = self.paper_instance.extract_ending_pages(3)
-        if ending_pages:
+        if self._has_text(ending_pages):
             self.ending_pages = ending_pages
-            self.extract_discussion()
-            self.extract_conclusion()
+        head_text = self.paper_instance.first_n_pages(5)
+        if not self._has_text(head_text) and not self.ending_pages:
+            logger.warning("Not enough text extracted from the paper to extract any section.")
+            return
+        self.prompt_instance.extract_key_information(head_text, self.ending_pages)
+        sections = self.parse_key_information(self.send_inquiry())
+        if not self.ending_pages:
+            # Without ending pages, the discussion and the conclusion are not extracted
+            sections.pop("discussion", None)
+            sections.pop("conclusion", None)
+        for section, response in sections.items():
+            self.extracted_information[section] = response
+            self.storage_instance.add_info_to_a_paper(self.paper_name, section, response)
+
+        self._extract_missing_sections(sections)
+
+    def _extract_missing_sections(self, sections: Collection[str]) -> None:
+        """
+        Extract the sections expected from the paper that are not among the given ones, each one
+        with its own inquiry, sent concurrently.
+
+        Args:
+            sections (Collection[str]): The names of the sections already extracted.
+        """
+        raw_texts = {
+            "abstract": self.paper_instance.first_n_pages(2),
+            "introduction": self.paper_instance.first_n_pages(5),
+        }
+        if self.ending_pages:
+            raw_texts["discussion"] = self.ending_pages
+            raw_texts["conclusion"] = self.ending_pages
+        missing_sections = {
+            section: raw_text
+            for section, raw_text in raw_texts.items()
+            if section not in sections and self._has_text(raw_text)
+        }
+        if missing_sections:
+            self._extract_sections(missing_sections)
+
+    @classmethod
+    def _has_text(cls, raw_text: Optional[str]) -> bool:
+        """Return whether the raw text is long enough to be worth an inquiry."""
+        return raw_text is not None and len(raw_text.strip()) >= cls._MIN_TEXT_LENGTH
+
+    @classmethod
+    def _expected_sections(cls, ending_pages: Optional[str]) -> tuple[str, ...]:
+        """Return the sections extracted from a paper, given the text of its ending pages (None
+        if they contain no text), from which the discussion and the conclusion are extracted."""
+        if ending_pages is None:
+            return ("abstract", "introduction")
+        return cls._KEY_SECTIONS
+
+    def _extract_sections(self, raw_texts: dict[str, str]) -> None:
+        """
+        Extract several sections from the paper concurrently, each one with its own inquiry.
+
+        Args:
+            raw_texts (dict[str, str]): The raw text to extract each section from, keyed by the
+                name of the section ("abstract", "introduction", "discussion", or "conclusion").
+        """
+
+        def extract(section: str) -> tuple[str, float]:
+            logger.info("---extracting %s---", section)
+            # A prompt instance per section, since the shared one is not safe across threads
+            prompt_instance = SurveyPrompt()
+            getattr(prompt_instance, f"extract_{section}")(raw_texts[section])
+            return _send_inquiry(
+                self.OpenAI_instance, self.model, prompt_instance.prompt, None, self.response_cache
+            )
+
+        with ThreadPoolExecutor(max_workers=len(raw_texts)) as executor:
+            results = list(executor.map(extract, raw_texts))
+
+        # The results are stored on the calling thread, in a deterministic order
+        for section, (response, cost) in zip(raw_texts, results):
+            self.cost_accumulation += cost
+            if response:
+                self.extracted_information[section] = response
+                self.storage_instance.add_info_to_a_paper(self.paper_name, section, response)
+
+    @classmethod
+    def parse_key_information(cls, response: Optional[str]) -> dict[str, str]:
+        """
+        Parse the response to a prompt generated by ``SurveyPrompt.extract_key_information``.
+
+        Args:
+            response (Optional[str]): The response, a JSON object that may be surrounded by
+                other text such as a Markdown code fence.
+
+        Returns:
+            dict[str, str]: The non-empty sections found in the response, keyed by their names.
+            Empty if the response is not a valid JSON object.
+
+        Example:
+            >>> AutoSurvey.parse_key_information('{"abstract": "We study", "introduction": ""}')
+            {'abstract': 'We study'}
+        """
+        match = cls._JSON_OBJECT_PATTERN.search(response or "")
+        if match is None:
+            return {}
+        try:
+            parsed = json.loads(match.group(0))
+        except ValueError:
+            return {}
+        if not isinstance(parsed, dict):
+            return {}
+        sections = {}
+        for section in cls._KEY_SECTIONS:
+            value = parsed.get(section)
+            if isinstance(value, str) and value.strip():
+                sections[section] = value
+        return sections
 
     def extraction(self) -> None:
         """
@@ -224,22 +609,22 @@ class AutoSurvey:
             try:
                 abstract = self.storage_instance.information[self.paper_name]["abstract"]
                 abstract = Storage.get_latest_trial(abstract)
-                self.paper_instance.extracted_information["abstract"] = abstract
+                self.extracted_information["abstract"] = abstract
                 introduction = self.storage_instance.information[self.paper_name]["introduction"]
                 introduction = Storage.get_latest_trial(introduction)
-                self.paper_instance.extracted_information["introduction"] = introduction
+                self.extracted_information["introduction"] = introduction
                 discussion = self.storage_instance.information[self.paper_name]["discussion"]
                 discussion = Storage.get_latest_trial(discussion)
-                self.paper_instance.extracted_information["discussion"] = discussion
+                self.extracted_information["discussion"] = discussion
                 conclusion = self.storage_instance.information[self.paper_name]["conclusion"]
                 conclusion = Storage.get_latest_trial(conclusion)
-                self.paper_instance.extracted_information["conclusion"] = conclusion
-                print("Summary information loaded from storage.")
+                self.extracted_information["conclusion"] = conclusion
+                logger.info("Summary information loaded from storage.")
             except KeyError:
-                print("Summary information not found in storage")
+                logger.info("Summary information not found in storage")
                 self.extraction_key_information()
             except FileNotFoundError:
-                print("Storage file not found")
+                logger.info("Storage file not found")
                 self.extraction_key_information()
         if self.approach == "new_trial":
             self.extraction_key_information()
@@ -252,12 +637,14 @@ class AutoSurvey:
             >>> survey = AutoSurvey(api_key, model, paper_path)
             >>> survey.extract_abstract()
         """
-        print("---extracting abstract---")
+        logger.info("---extracting abstract---")
         raw_text = self.paper_instance.first_n_pages(2)
+        if not self._has_text(raw_text):
+            return
         self.prompt_instance.extract_abstract(raw_text)
         response = self.send_inquiry()
         if response:
-            self.paper_instance.extracted_information["abstract"] = response
+            self.extracted_information["abstract"] = response
             self.storage_instance.add_info_to_a_paper(self.paper_name, "abstract", response)
 
     def extract_introduction(self) -> None:
@@ -268,12 +655,14 @@ class AutoSurvey:
             >>> survey = AutoSurvey(api_key, model, paper_path)
             >>> survey.extract_introduction()
         """
-        print("---extracting introduction---")
+        logger.info("---extracting introduction---")
         raw_text = self.paper_instance.first_n_pages(5)
+        if not self._has_text(raw_text):
+            return
         self.prompt_instance.extract_introduction(raw_text)
         response = self.send_inquiry()
         if response:
-            self.paper_instance.extracted_information["introduction"] = response
+            self.extracted_information["introduction"] = response
             self.storage_instance.add_info_to_a_paper(self.paper_name, "introduction", response)
 
     def extract_discussion(self) -> None:
@@ -284,12 +673,12 @@ class AutoSurvey:
             >>> survey = AutoSurvey(api_key, model, paper_path)
             >>> survey.extract_discussion()
         """
-        print("---extracting discussion---")
+        logger.info("---extracting discussion---")
         if self.ending_pages:
             self.prompt_instance.extract_discussion(self.ending_pages)
             response = self.send_inquiry()
             if response:
-                self.paper_instance.extracted_information["discussion"] = response
+                self.extracted_information["discussion"] = response
                 self.storage_instance.add_info_to_a_paper(self.paper_name, "discussion", response)
 
     def extract_conclusion(self) -> None:
@@ -300,12 +689,12 @@ class AutoSurvey:
             >>> survey = AutoSurvey(api_key, model, paper_path)
             >>> survey.extract_conclusion()
         """
-        print("---extracting conclusion---")
+        logger.info("---extracting conclusion---")
         if self.ending_pages:
             self.prompt_instance.extract_conclusion(self.ending_pages)
             response = self.send_inquiry()
             if response:
-                self.paper_instance.extracted_information["conclusion"] = response
+                self.extracted_information["conclusion"] = response
                 self.storage_instance.add_info_to_a_paper(self.paper_name, "conclusion", response)
 
     def summarize_computer_science(self) -> None:
@@ -316,20 +705,27 @@ class AutoSurvey:
             >>> survey = AutoSurvey(api_key, model, paper_path)
             >>> survey.summarize_computer_science()
         """
-        print("---summarizing---")
+        logger.info("---summarizing---")
         self.prompt_instance.summarize_default_computer_science(
-            self.paper_instance.extracted_information["abstract"],
-            self.paper_instance.extracted_information["introduction"],
-            self.paper_instance.extracted_information["discussion"],
-            self.paper_instance.extracted_information["conclusion"],
+            self.extracted_information["abstract"],
+            self.extracted_information["introduction"],
+            self.extracted_information["discussion"],
+            self.extracted_information["conclusion"],
         )
 
-        self.output = self.send_inquiry()
+        if self.stream:
+            print("The summary is:")
+            print()
+            self.output = self.send_inquiry_and_print()
+        else:
+            self.output = self.send_inquiry()
         # TODO: change the output style
 
         self.storage_instance.add_info_to_a_paper(self.paper_name, "summary", self.output)
 
-    def explain_computer_science(self) -> None:
+    def explain_computer_science(
+        self, questions: Optional[list[str]] = None, max_concurrency: int = 4
+    ) -> None:
         """
         Generate explanations for computer science papers.
 
@@ -337,10 +733,23 @@ class AutoSurvey:
         the paper content and the question to the LLM for an answer. The process
         loops until the user cancels it.
 
+        If the questions are given in advance, they are answered independently of each other,
+        with up to max_concurrency inquiries in flight at the same time, and no input is asked.
+
+        Args:
+            questions (Optional[list[str]]): The questions to answer. If None, the questions are
+                asked interactively. Defaults to None.
+            max_concurrency (int): Maximum number of inquiries in flight at the same time when
+                questions are given. Defaults to 4.
+
         Example:
             >>> survey = AutoSurvey(api_key, model, paper_path)
             >>> survey.explain_computer_science()
+            >>> survey.explain_computer_science(["What is the main idea?", "What is new?"])
         """
+        if questions is not None:
+            self._explain_computer_science_batch(questions, max_concurrency)
+            return
 
         response = None
         while True:
@@ -350,21 +759,450 @@ class AutoSurvey:
                 break
 
             self.prompt_instance.explain_default_computer_science(
-                self.paper_instance.extracted_information["abstract"],
-                self.paper_instance.extracted_information["introduction"],
-                self.paper_instance.extracted_information["discussion"],
-                self.paper_instance.extracted_information["conclusion"],
+                self.extracted_information["abstract"],
+                self.extracted_information["introduction"],
+                self.extracted_information["discussion"],
+                self.extracted_information["conclusion"],
                 question,
                 response,
             )
 
-            response = self.send_inquiry()
+            response = self.send_inquiry_and_print()
 
             self.prompt_instance.input_history.append(question)
             self.prompt_instance.output_history.append(response)
 
+    def _explain_computer_science_batch(self, questions: list[str], max_concurrency: int) -> None:
+        """
+        Answer several questions about the paper concurrently, each one with its own prompt.
+
+        Args:
+            questions (list[str]): The questions to answer.
+            max_concurrency (int): Maximum number of inquiries in flight at the same time.
+        """
+        extracted_information = self.extracted_information
+
+        def ask(question: str) -> tuple[str, float]:
+            # A fresh prompt instance per question, since the questions have no shared history
+            prompt_instance = SurveyPrompt()
+            prompt_instance.explain_default_computer_science(
+                abstract=extracted_information["abstract"],
+                introduction=extracted_information["introduction"],
+                discussion=extracted_information["discussion"],
+                conclusion=extracted_information["conclusion"],
+                user_question=question,
+                past_response=None,
+            )
+            return _send_inquiry(
+                self.OpenAI_instance, self.model, prompt_instance.prompt, None, self.response_cache
+            )
+
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+            results = list(executor.map(ask, questions))
+
+        for question, (response, cost) in zip(questions, results):
+            self.cost_accumulation += cost
+            self.prompt_instance.input_history.append(question)
+            self.prompt_instance.output_history.append(response)
+            print(f"Question: {question}")
             print(response)
 
     def findings(self) -> None:
         """Extract key findings from the paper (placeholder for future implementation)."""
         raise NotImplementedError
+
+
+class AutoSurveyBatch:
+    """
+    A class for retrieving the same information from many research papers with few inquiries.
+
+    Instead of sending one inquiry per paper, the papers are grouped into batches and the text
+    of all papers in a batch is sent in a single inquiry, which amortizes the per-request
+    overhead and the shared instructions over the batch. Papers whose answer is missing from
+    the batched response, or does not pass the tests, are retried individually with
+    :class:`AutoSurvey`.
+
+    The key sections of many papers can also be extracted through the OpenAI Batch API with
+    :meth:`extraction_key_information`, which is billed at half the price of regular inquiries.
+
+    Args:
+        api_key (str): The API key for GPT model access.
+        model (str): The GPT model identifier to use.
+        paper_paths (list[str]): Paths to the research paper PDF files.
+        debug (bool, optional): Enable debug mode for detailed logging. Defaults to False.
+        batch_size (int, optional): Number of papers sent in one inquiry. Defaults to 8.
+        max_characters (int, optional): Maximum number of characters of each paper included in
+            a batched inquiry. Defaults to 40000.
+        max_concurrency (int, optional): Maximum number of batched inquiries in flight at the
+            same time. Defaults to 1.
+        storage_path (str, optional): Path to the storage file for saving extracted information.
+            Defaults to "papers.json".
+        response_cache (ResponseCache, optional): Persistent cache of LLM responses. Defaults to
+            None (no caching).
+        cache_responses (bool, optional): If True and no response_cache is given, the responses
+            are cached next to the storage file, see :func:`default_response_cache`. Defaults to
+            False.
+        text_cache_folder (str, optional): Folder for caching the text extracted from the PDF
+            files. If None, the text is not cached. Defaults to ``~/.auto_research/pdf_cache``.
+        OpenAI_instance (OpenAI_interface, optional): An existing GPT handler to reuse. If None,
+            a new handler is created from api_key, model and debug. Defaults to None.
+
+    Attributes:
+        OpenAI_instance (OpenAI_interface): Instance of GPT handler for text processing.
+        prompt_instance (SurveyPrompt): Instance for generating prompts.
+        storage_instance (Storage): Instance for storing and retrieving extracted information.
+        outputs (list[Optional[str]]): The retrieved information for each paper, in the order
+            of paper_paths. None if the information could not be retrieved.
+        cost_accumulation (float): Accumulated cost of API usage.
+
+    Example:
+        >>> batch = AutoSurveyBatch(
+        ...     api_key="your-api-key",
+        ...     model="gpt-4o-mini",
+        ...     paper_paths=["path/to/paper1.pdf", "path/to/paper2.pdf"],
+        ... )
+        >>> batch.run(base_prompt_formatted(), test_github_link)
+    """
+
+    _ANSWER_PATTERN = re.compile(r"^\s*<<<(\d+)>>>[ \t]*(.*?)\s*$", re.MULTILINE)
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        paper_paths: list[str],
+        debug: bool = False,
+        batch_size: int = 8,
+        max_characters: int = 40000,
+        max_concurrency: int = 1,
+        storage_path: str = "papers.json",
+        response_cache: Optional[ResponseCache] = None,
+        cache_responses: bool = False,
+        text_cache_folder: Optional[str] = DEFAULT_TEXT_CACHE_FOLDER,
+        OpenAI_instance: Optional[OpenAI_interface] = None,
+    ) -> None:
+        self.OpenAI_instance = (
+            OpenAI_instance
+            if OpenAI_instance is not None
+            else OpenAI_interface(api_key, model=model, debug=debug)
+        )
+        self.api_key = api_key
+        self.model = model
+        self.paper_paths = paper_paths
+        self.debug = debug
+        self.batch_size = batch_size
+        self.max_characters = max_characters
+        self.max_concurrency = max_concurrency
+        self.storage_path = storage_path
+        self.prompt_instance = SurveyPrompt()
+        self.storage_instance = Storage(storage_path)
+        if response_cache is None and cache_responses:
+            response_cache = default_response_cache(storage_path)
+        self.response_cache = response_cache
+        self.text_cache_folder = text_cache_folder
+        self.outputs: list[Optional[str]] = []
+        self.cost_accumulation: float = 0.0
+
+    def run(self, target_information: str, tests: Optional[Callable] = None) -> None:
+        """
+        Retrieve the information from all papers and print the results.
+
+        Args:
+            target_information (str): The specific information to retrieve.
+            tests (Optional[Callable]): A callable function for testing each retrieved answer.
+        """
+        self.information_retrieval(target_information, tests)
+        for paper_path, output in zip(self.paper_paths, self.outputs):
+            print(f"The retrieved information for {os.path.basename(paper_path)} is:")
+            print(output if output is not None else "Failed to retrieve the information")
+        print(f"The total cost is {self.cost_accumulation} USD")
+
+    @classmethod
+    def parse_batch_response(cls, response: str, number_of_papers: int) -> list[Optional[str]]:
+        """
+        Split a batched response into the answers for the individual papers.
+
+        Args:
+            response (str): The response to a batched inquiry.
+            number_of_papers (int): Number of papers in the batch.
+
+        Returns:
+            list[Optional[str]]: The answer for each paper, None if it is missing.
+
+        Example:
+            >>> AutoSurveyBatch.parse_batch_response("<<<1>>>not available", 2)
+            ['not available', None]
+        """
+        answers: list[Optional[str]] = [None] * number_of_papers
+        for match in cls._ANSWER_PATTERN.finditer(response or ""):
+            idx = int(match.group(1)) - 1
+            if 0 <= idx < number_of_papers and match.group(2) and answers[idx] is None:
+                answers[idx] = match.group(2)
+        return answers
+
+    def information_retrieval(
+        self, target_information: str, tests: Optional[Callable] = None
+    ) -> list[Optional[str]]:
+        """
+        Retrieve the specific information from all papers.
+
+        Args:
+            target_information (str): The specific information to retrieve.
+            tests (Optional[Callable]): A callable function for testing each retrieved answer.
+
+        Returns:
+            list[Optional[str]]: The retrieved information for each paper, None if it could not
+            be retrieved.
+        """
+        # Read the papers on the calling thread, since PyMuPDF is not thread-safe
+        raw_texts = []
+        for paper_path in self.paper_paths:
+            paper_instance = Paper(paper_path, model=self.model)
+            paper_instance.read_pymupdf(self.text_cache_folder)
+            raw_texts.append((paper_instance.get_whole_paper() or "")[: self.max_characters])
+
+        starts = range(0, len(self.paper_paths), self.batch_size)
+        with ThreadPoolExecutor(max_workers=max(1, self.max_concurrency)) as executor:
+            batched_results = list(
+                executor.map(
+                    lambda start: self._ask_batch(
+                        raw_texts[start : start + self.batch_size], target_information
+                    ),
+                    starts,
+                )
+            )
+        answers = [answer for batch_answers, _ in batched_results for answer in batch_answers]
+        self.cost_accumulation += sum(cost for _, cost in batched_results)
+
+        self.outputs = []
+        info_type = f"information_retrieval:{target_information}"
+        # The answers are written to the storage file once, after all papers are processed
+        with self.storage_instance.deferred_saves():
+            for paper_path, answer in zip(self.paper_paths, answers):
+                if answer is not None and tests:
+                    try:
+                        answer = tests(answer)
+                    except Exception as exception:
+                        logger.warning(
+                            "Answer for %s rejected: %s", os.path.basename(paper_path), exception
+                        )
+                        answer = None
+
+                if answer is None:
+                    answer = self._retrieve_individually(paper_path, target_information, tests)
+                else:
+                    self.storage_instance.add_info_to_a_paper(
+                        os.path.basename(paper_path), info_type, answer
+                    )
+                self.outputs.append(answer)
+        return self.outputs
+
+    def _ask_batch(
+        self, raw_texts: list[str], target_information: str
+    ) -> tuple[list[Optional[str]], float]:
+        """
+        Send one batched inquiry and return the answer for each paper in the batch.
+
+        Args:
+            raw_texts (list[str]): The raw texts of the papers in the batch.
+            target_information (str): The specific information to retrieve.
+
+        Returns:
+            tuple[list[Optional[str]], float]: The answer for each paper (None if it is missing)
+            and the cost of the inquiry.
+        """
+        prompt_instance = SurveyPrompt()
+        prompt_instance.information_retrieval_batch(raw_texts, target_information)
+        response, cost = _send_inquiry(
+            self.OpenAI_instance, self.model, prompt_instance.prompt, None, self.response_cache
+        )
+        return self.parse_batch_response(response, len(raw_texts)), cost
+
+    def extraction_key_information(self, poll_interval: float = 60.0) -> None:
+        """
+        Extract the abstract, introduction, discussion, and conclusion of all papers and store
+        them, submitting one job to the OpenAI Batch API for all papers.
+
+        The job may take up to 24 hours; its status is checked every poll_interval seconds.
+        Papers whose sections are already stored are skipped, so that :class:`AutoSurvey` with
+        the "load" approach can then summarize each paper from the stored sections; the
+        discussion and the conclusion are only expected from papers with ending pages. With
+        fewer than ``_MIN_BATCH_API_PAPERS`` papers, or for papers missing from the results of
+        the job, the sections are extracted with regular inquiries instead; sections missing
+        from the results of a paper are extracted with their own inquiries. The cost of the job
+        is not included in cost_accumulation.
+
+        Args:
+            poll_interval (float): Number of seconds between two checks of the job status.
+                Defaults to 60.
+
+        Example:
+            >>> batch = AutoSurveyBatch("your-api-key", "gpt-4o-mini", paper_paths)
+            >>> batch.extraction_key_information()
+            >>> for paper_path in paper_paths:
+            ...     AutoSurvey("your-api-key", "gpt-4o-mini", paper_path).run()
+        """
+        try:
+            self.storage_instance.load_info()
+            stored_information = self.storage_instance.information
+        except FileNotFoundError:
+            stored_information = {}
+
+        # The papers with sections to extract, with the text of their ending pages (None if they
+        # contain no text) and the sections to extract. The papers are read on the calling
+        # thread, since PyMuPDF is not thread-safe.
+        papers: list[tuple[Paper, Optional[str], list[str]]] = []
+        for paper_path in self.paper_paths:
+            stored_sections = stored_information.get(os.path.basename(paper_path), {})
+            if all(section in stored_sections for section in AutoSurvey._KEY_SECTIONS):
+                continue
+            paper_instance = Paper(
+                paper_path, model=self.model, text_cache_folder=self.text_cache_folder
+            )
+            ending_pages: Optional[str] = paper_instance.extract_ending_pages(3)
+            if not AutoSurvey._has_text(ending_pages):
+                ending_pages = None
+            missing_sections = [
+                section
+                for section in AutoSurvey._expected_sections(ending_pages)
+                if section not in stored_sections
+            ]
+            if missing_sections:
+                papers.append((paper_instance, ending_pages, missing_sections))
+
+        sections_by_paper: list[dict[str, str]] = [{} for _ in papers]
+        if len(papers) >= _MIN_BATCH_API_PAPERS:
+            prompts = []
+            for paper_instance, ending_pages, _ in papers:
+                prompt_instance = SurveyPrompt()
+                prompt_instance.extract_key_information(
+                    paper_instance.first_n_pages(5), ending_pages
+                )
+                prompts.append(prompt_instance.prompt)
+
+            responses = self._ask_batch_api(prompts, poll_interval)
+            for idx, response in enumerate(responses):
+                sections = AutoSurvey.parse_key_information(response)
+                # Only the sections expected and not stored yet are kept
+                sections_by_paper[idx] = {
+                    section: sections[section] for section in papers[idx][2] if section in sections
+                }
+
+        with self.storage_instance.deferred_saves():
+            for (paper_instance, ending_pages, missing_sections), sections in zip(
+                papers, sections_by_paper
+            ):
+                paper_name = os.path.basename(paper_instance.paper_path)
+                for section, response in sections.items():
+                    self.storage_instance.add_info_to_a_paper(paper_name, section, response)
+                expected_sections = AutoSurvey._expected_sections(ending_pages)
+                still_missing = [
+                    section for section in missing_sections if section not in sections
+                ]
+                if not still_missing:
+                    continue
+
+                auto_survey_instance = AutoSurvey(
+                    self.api_key,
+                    self.model,
+                    paper_instance.paper_path,
+                    self.debug,
+                    storage_path=self.storage_path,
+                    response_cache=self.response_cache,
+                    OpenAI_instance=self.OpenAI_instance,
+                    paper_instance=paper_instance,
+                )
+                auto_survey_instance.storage_instance = self.storage_instance
+                if len(still_missing) == len(expected_sections):
+                    # No section is stored or extracted by the job, so all of them are extracted
+                    # with a single inquiry
+                    auto_survey_instance.extraction_key_information()
+                else:
+                    # Only the missing sections are extracted, so that no section is stored twice
+                    auto_survey_instance.ending_pages = ending_pages
+                    auto_survey_instance._extract_missing_sections(
+                        [section for section in expected_sections if section not in still_missing]
+                    )
+                self.cost_accumulation += auto_survey_instance.cost_accumulation
+
+    def _ask_batch_api(self, prompts: list[Any], poll_interval: float) -> list[Optional[str]]:
+        """
+        Send prompts as one job of the OpenAI Batch API and wait for the responses.
+
+        Args:
+            prompts (list[Any]): The formatted prompts.
+            poll_interval (float): Number of seconds between two checks of the job status.
+
+        Returns:
+            list[Optional[str]]: The response to each prompt, None if it is missing.
+        """
+        client = openai.OpenAI(api_key=self.api_key)
+        with tempfile.TemporaryFile("w+b") as requests_file:
+            for idx, prompt in enumerate(prompts):
+                request = {
+                    "custom_id": str(idx),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {"model": self.model, "messages": prompt},
+                }
+                requests_file.write(json.dumps(request).encode("utf-8") + b"\n")
+            requests_file.seek(0)
+            input_file = client.files.create(
+                file=("requests.jsonl", requests_file), purpose="batch"
+            )
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        logger.info("Submitted the batch job %s for %d papers", batch.id, len(prompts))
+        while batch.status not in _BATCH_API_FINAL_STATUSES:
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch.id)
+        logger.info("The batch job %s is %s", batch.id, batch.status)
+
+        responses: list[Optional[str]] = [None] * len(prompts)
+        if batch.output_file_id is None:
+            return responses
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            body = (result.get("response") or {}).get("body") or {}
+            choices = body.get("choices") or []
+            idx = int(result["custom_id"])
+            if choices and 0 <= idx < len(prompts):
+                responses[idx] = choices[0]["message"]["content"]
+        return responses
+
+    def _retrieve_individually(
+        self, paper_path: str, target_information: str, tests: Optional[Callable] = None
+    ) -> Optional[str]:
+        """
+        Retrieve the information from a single paper with its own inquiry.
+
+        Args:
+            paper_path (str): Path to the research paper PDF file.
+            target_information (str): The specific information to retrieve.
+            tests (Optional[Callable]): A callable function for testing the response sequence.
+
+        Returns:
+            Optional[str]: The retrieved information, None if the retrieval failed.
+        """
+        auto_survey_instance = AutoSurvey(
+            self.api_key,
+            self.model,
+            paper_path,
+            self.debug,
+            "information_retrieval",
+            storage_path=self.storage_path,
+            response_cache=self.response_cache,
+            text_cache_folder=self.text_cache_folder,
+            OpenAI_instance=self.OpenAI_instance,
+        )
+        try:
+            auto_survey_instance.information_retrieval(target_information, tests)
+        except Exception as exception:
+            logger.warning("Failed to retrieve the information from %s: %s", paper_path, exception)
+        self.cost_accumulation += auto_survey_instance.cost_accumulation
+        return auto_survey_instance.output
@@ -1,26 +1,93 @@
 from __future__ import annotations
 
+import bisect
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import hashlib
+import itertools
+import json
+import os
+import re
+import threading
+from typing import Any
 from typing import Optional
+import warnings
 
 import fitz
-from PyPDF2 import PdfReader
 import tiktoken
 
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; it only speeds up reading and writing cached text
+    orjson = None  # type: ignore[assignment]
+
+# Default folder for caching the text extracted from PDF files, shared by all surveys of the user
+DEFAULT_TEXT_CACHE_FOLDER = os.path.join(os.path.expanduser("~"), ".auto_research", "pdf_cache")
+
+
+# PyMuPDF does not support multithreading, and documents are shared between Paper instances,
+# which may be read from different threads, e.g. by concurrent surveys
+_PYMUPDF_LOCK = threading.RLock()
+
+
+def _load_json(path: str) -> Any:
+    if orjson is not None:
+        with open(path, "rb") as binary_file:
+            return orjson.loads(binary_file.read())
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def _dump_json(data: Any, path: str) -> None:
+    # Write to a temporary file first so that concurrent readers never see a partial file
+    temporary_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    if orjson is not None:
+        with open(temporary_path, "wb") as binary_file:
+            binary_file.write(orjson.dumps(data))
+    else:
+        with open(temporary_path, "w") as file:
+            json.dump(data, file)
+    os.replace(temporary_path, path)
+
+
+@lru_cache(maxsize=32)
+def _open_pdf(paper_path: str, mtime_ns: int, size: int) -> fitz.Document:
+    # The modification time and size are part of the key, so that a file modified since it was
+    # opened is opened again. Documents are shared by the Paper instances of the same file, so
+    # they must not be closed; a document is closed once it is evicted and no longer used.
+    return fitz.open(paper_path)
+
+
+@lru_cache(maxsize=None)
+def _encoder_for_model(model: str) -> tiktoken.Encoding:
+    """Return the tiktoken encoder of the given model, built once per model."""
+    return tiktoken.encoding_for_model(model)
+
+
+@lru_cache(maxsize=32)
+def _marker_pattern(markers: tuple[str, ...]) -> re.Pattern:
+    """Compile a pattern matching any of the given (non-empty) markers, ignoring case."""
+    return re.compile("|".join(map(re.escape, markers)), re.IGNORECASE)
+
+
 class Paper:
     """
     A class for reading and extracting information from research articles in PDF format.
 
-    This class provides functionality to read PDF files using different libraries (PyPDF2 and
-    PyMuPDF), extract specific sections, and analyze the content of research papers.
+    This class provides functionality to read PDF files using PyMuPDF, extract specific
+    sections, and analyze the content of research papers.
 
     Args:
         paper_path: Path to the PDF file containing the research paper.
         model: Name of the GPT model to use for token counting. Defaults to 'gpt-4o-mini'.
+        text_cache_folder: Folder for caching the extracted text, used when the PDF file is read
+            lazily. Defaults to None (no caching).
 
     Attributes:
         paper_path (str): Path to the PDF file.
-        whole_paper (list[str]): List containing the text content of each page.
+        whole_paper (list[str]): List containing the text content of each page. If no read
+            method was called, the PDF file is read with PyMuPDF the first time it is accessed.
         paper_length (int): Total number of tokens in the paper based on the specified model.
         model (str): Name of the GPT model used for token counting.
         extracted_information (dict[str, str]): Dictionary containing extracted sections of the
@@ -34,17 +101,35 @@ class Paper:
         1234
 
     Notes:
-        The class supports both PyPDF2 and PyMuPDF (fitz) for PDF processing,
-        allowing flexibility in PDF parsing approaches.
+        PDF files are parsed with PyMuPDF (fitz). The former PyPDF2 backend, about an order of
+        magnitude slower, is deprecated: ``read_pypdf2`` now reads the file with PyMuPDF.
     """
 
     # Class-level constants for section markers
     _END_MARKERS: list[str] = ["references", "acknowledgement", "bibliography"]
-
-    def __init__(self, paper_path: str, model: str = "gpt-4o-mini") -> None:
+    # Compiled once, when the class is created; the search ignores case, so the text of the
+    # paper is never lowercased as a whole
+    _END_MARKER_PATTERN: re.Pattern = _marker_pattern(tuple(_END_MARKERS))
+
+    def __init__(
+        self,
+        paper_path: str,
+        model: str = "gpt-4o-mini",
+        text_cache_folder: Optional[str] = None,
+    ) -> None:
         """Initialize the Paper instance with the given PDF path and model."""
         self.paper_path: str = paper_path
-        self.whole_paper: list[str] = []
+        self.text_cache_folder: Optional[str] = text_cache_folder
+        self._whole_paper: Optional[list[str]] = None
+        self._document: Optional[fitz.Document] = None
+        self._page_texts: dict[int, str] = {}
+        self._first_pages_texts: dict[int, str] = {}
+        self._text_cache_paths: dict[str, str] = {}
+        self._page_count: Optional[int] = None
+        # Whether the first pages cached by a previous lazy read were loaded, and how many first
+        # pages are cached
+        self._first_pages_loaded: bool = False
+        self._cached_first_pages: int = 0
         self.paper_length: int = 0
         self.model: str = model
         self.extracted_information: dict[str, str] = {
@@ -55,45 +140,245 @@ class Paper:
             "algorithm": "",
         }
 
+    @property
+    def whole_paper(self) -> list[str]:
+        # Read the PDF file on first use, so that papers whose information is already stored are
+        # never parsed
+        if self._whole_paper is None:
+            self.read_pymupdf(self.text_cache_folder)
+        assert self._whole_paper is not None
+        return self._whole_paper
+
+    @whole_paper.setter
+    def whole_paper(self, pages: list[str]) -> None:
+        self._whole_paper = pages
+        self._first_pages_texts = {}
+
     def read_pypdf2(self) -> None:
         """
-        Read PDF content using PyPDF2 library.
+        Read PDF content, formerly using PyPDF2 library.
 
-        This method extracts text from each page of the PDF using PyPDF2 and stores
-        it in the whole_paper list.
+        Deprecated: PyPDF2 parses PDF files in pure Python, about an order of magnitude slower
+        than PyMuPDF, so this method now reads the PDF file again with ``read_pymupdf``. Use
+        ``read_pymupdf`` instead.
 
         Example:
             >>> paper = Paper("example.pdf")
             >>> paper.read_pypdf2()
         """
-        pdf_obj = PdfReader(self.paper_path)
-        self.whole_paper = []
-        for page in pdf_obj.pages:
-            text = page.extract_text()
-            self.whole_paper.append(text)
+        warnings.warn(
+            "Paper.read_pypdf2 is deprecated and reads the PDF file with PyMuPDF; "
+            "use Paper.read_pymupdf instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        self.read_pymupdf(force_refresh=True)
 
-    def read_pymupdf(self) -> None:
+    def read_pymupdf(
+        self, cache_folder: Optional[str] = None, force_refresh: bool = False
+    ) -> None:
         """
         Read PDF content using PyMuPDF library.
 
         This method extracts text from each page of the PDF using PyMuPDF (fitz)
-        and stores it in the whole_paper list.
+        and stores it in the whole_paper list. If the paper has already been read, it does
+        nothing, unless force_refresh is True.
+
+        Args:
+            cache_folder: Folder for caching the extracted text. If given, the text is loaded
+                from the cache when the PDF file is unchanged, and saved to it otherwise.
+                Defaults to None (no caching).
+            force_refresh: If True, the PDF file is parsed even if it has already been read or
+                its text is cached, and the cached text is replaced. Defaults to False.
 
         Example:
             >>> paper = Paper("example.pdf")
             >>> paper.read_pymupdf()
         """
-        pdf_document = fitz.open(self.paper_path)
-        self.whole_paper = []
-        for page_num in range(pdf_document.page_count):
-            page = pdf_document[page_num]
-            text = page.get_text()
-            self.whole_paper.append(text)
+        if self._whole_paper is not None and not force_refresh:
+            return
+
+        cache_path = self._text_cache_path(cache_folder) if cache_folder else None
+        if cache_path is not None and not force_refresh and os.path.exists(cache_path):
+            self.whole_paper = _load_json(cache_path)
+            return
+
+        if force_refresh:
+            # Parse every page again rather than reusing the pages already parsed or cached
+            self._page_texts = {}
+            self._page_count = None
+            self._first_pages_loaded = True
+        self.whole_paper = [
+            self._page_text(page_num) for page_num in range(self._get_page_count())
+        ]
+        # Every page is now held in whole_paper, so the document and the page cache are released
+        self._document = None
+        self._page_texts = {}
+
+        if cache_path is not None:
+            _dump_json(self.whole_paper, cache_path)
+            # The first pages cached by a lazy read are superseded by the whole text
+            try:
+                os.remove(self._first_pages_cache_path(cache_path))
+            except FileNotFoundError:
+                pass
+
+    def _open_document(self) -> fitz.Document:
+        """Open the PDF file with PyMuPDF, reusing the document opened for the same unmodified
+        file by a previous call, of this instance or another one."""
+        if self._document is None:
+            stat = os.stat(self.paper_path)
+            with _PYMUPDF_LOCK:
+                self._document = _open_pdf(self.paper_path, stat.st_mtime_ns, stat.st_size)
+        return self._document
+
+    def _get_page_count(self) -> int:
+        """Return the number of pages of the PDF file, opening it only if needed."""
+        self._load_first_pages()
+        if self._page_count is None:
+            self._page_count = self._open_document().page_count
+        return self._page_count
+
+    def _page_text(self, page_num: int) -> str:
+        """Return the text of the given page, extracting each page at most once."""
+        self._load_first_pages()
+        text = self._page_texts.get(page_num)
+        if text is None:
+            with _PYMUPDF_LOCK:
+                text = self._page_texts[page_num] = self._open_document()[page_num].get_text()
+        return text
+
+    @staticmethod
+    def _first_pages_cache_path(cache_path: str) -> str:
+        """Return the path of the first pages cached by a lazy read, from that of the text."""
+        return f"{os.path.splitext(cache_path)[0]}.first_pages.json"
+
+    def _load_first_pages(self) -> None:
+        """
+        Load the first pages cached by a previous lazy read of the PDF file, if any.
+
+        Lazy reads parse the first pages of the paper only, so they do not cache its text;
+        instead, the pages parsed are cached separately, and loaded before any page is parsed.
+        """
+        if self._first_pages_loaded:
+            return
+        with _PYMUPDF_LOCK:
+            if self._first_pages_loaded:
+                return
+            self._first_pages_loaded = True
+            if self._whole_paper is not None or self.text_cache_folder is None:
+                return
+            path = self._first_pages_cache_path(self._text_cache_path(self.text_cache_folder))
+            if not os.path.exists(path):
+                return
+            cached = _load_json(path)
+            self._page_count = cached["page_count"]
+            for page_num, text in enumerate(cached["pages"]):
+                self._page_texts.setdefault(page_num, text)
+            self._cached_first_pages = len(cached["pages"])
+
+    def _save_first_pages(self) -> None:
+        """Cache the first pages parsed so far, if more of them were parsed than are cached."""
+        if self.text_cache_folder is None:
+            return
+        with _PYMUPDF_LOCK:
+            pages: list[str] = []
+            while len(pages) in self._page_texts:
+                pages.append(self._page_texts[len(pages)])
+        if len(pages) <= self._cached_first_pages:
+            return
+        path = self._first_pages_cache_path(self._text_cache_path(self.text_cache_folder))
+        _dump_json({"page_count": self._get_page_count(), "pages": pages}, path)
+        self._cached_first_pages = len(pages)
+
+    def _reads_lazily(self) -> bool:
+        """Return whether pages should be parsed on demand, i.e. the PDF file has not been read
+        yet and its text is not cached."""
+        return self._whole_paper is None and not (
+            self.text_cache_folder is not None
+            and os.path.exists(self._text_cache_path(self.text_cache_folder))
+        )
+
+    def _pages_up_to_end_marker(self) -> list[str]:
+        """
+        Return the first pages of the paper, up to the page containing its first end marker.
+
+        The pages are parsed in order until the first end marker found by
+        ``extract_up_to_first_match_exclude_list`` is known, so that the references and
+        appendices, often the longest part of a paper, are not parsed.
+
+        Returns:
+            list[str]: The text of the pages parsed, from the first page.
+        """
+        if not self._reads_lazily():
+            return self.whole_paper
+
+        pattern = self._END_MARKER_PATTERN
+        longest_marker = max(map(len, self._END_MARKERS))
+        page_count = self._get_page_count()
+        pages: list[str] = []
+        text = ""
+        search_start = 0
+        for page_num in range(page_count):
+            page = self._page_text(page_num)
+            pages.append(page)
+            text += page
+            if len(pages) <= 3:
+                search_start = len(text)
+                continue
+            match = pattern.search(text, search_start)
+            # A marker not found yet could still start before the match found, if it overlaps
+            # the next page, i.e. if the parsed text ends with the beginning of the marker
+            if match is not None and not any(
+                marker.startswith(text[start:].lower())
+                for marker in self._END_MARKERS
+                for start in range(max(search_start, len(text) - len(marker) + 1), match.start())
+            ):
+                self._save_first_pages()
+                return pages
+            # The text searched so far contains no marker, except possibly one continuing on the
+            # next page, so only its end is searched again
+            search_start = max(search_start, len(text) - longest_marker + 1)
+
+        # Every page was parsed, so the whole paper is kept (and cached)
+        self.read_pymupdf(self.text_cache_folder)
+        return self.whole_paper
+
+    def _text_cache_path(self, cache_folder: str) -> str:
+        """
+        Return the path of the cached text of the PDF file in the given folder.
+
+        The file name is derived from the beginning of the file content, its size and its
+        modification time, so that a modified PDF file is read again. The path is computed once
+        per instance and folder.
+
+        Args:
+            cache_folder: Folder for caching the extracted text.
+
+        Returns:
+            str: The path to the cache file.
+        """
+        path = self._text_cache_paths.get(cache_folder)
+        if path is None:
+            stat = os.stat(self.paper_path)
+            with open(self.paper_path, "rb") as file:
+                digest = hashlib.sha1(file.read(65536))
+            digest.update(f"{stat.st_size}-{stat.st_mtime_ns}".encode())
+            os.makedirs(cache_folder, exist_ok=True)
+            path = self._text_cache_paths[cache_folder] = os.path.join(
+                cache_folder, f"{digest.hexdigest()}.json"
+            )
+        return path
 
     def first_n_pages(self, n: int) -> str:
         """
         Return the concatenated text of the first n pages.
 
+        If the PDF file has not been read yet and its text is not cached, only the first n pages
+        are parsed, and they are kept for later calls and, if the text is cached, for later reads
+        of the same file. The concatenated text is also kept, so that the prompts asking for the
+        same pages do not join them again.
+
         Args:
             n: Number of pages to include.
 
@@ -105,7 +390,16 @@ class Paper:
             >>> paper.read_pymupdf()
             >>> first_three = paper.first_n_pages(3)
         """
-        return "".join(self.whole_paper[:n])
+        text = self._first_pages_texts.get(n)
+        if text is None:
+            if self._reads_lazily():
+                page_count = self._get_page_count()
+                text = "".join(self._page_text(page_num) for page_num in range(min(n, page_count)))
+                self._save_first_pages()
+            else:
+                text = "".join(self.whole_paper[:n])
+            self._first_pages_texts[n] = text
+        return text
 
     def get_whole_paper(self, print_mode: bool = False) -> Optional[str]:
         """
@@ -152,6 +446,9 @@ class Paper:
         """
         Extract content up to the first occurrence of any marker in the exclude list.
 
+        Markers are matched regardless of letter case, and only after the first three strings.
+        All markers are searched for in a single pass over the text.
+
         Args:
             a: List of strings to concatenate and search within.
             b_list: List of substrings to search for.
@@ -164,37 +461,22 @@ class Paper:
             >>> text_list = ["Page 1", "Page 2", "References", "Page 3"]
             >>> result = Paper.extract_up_to_first_match_exclude_list(text_list, ["references"])
         """
-        concatenated_a = "".join(a)
-        first_three_pages = "".join(a[:3])
-        lower_concatenated_a = concatenated_a.lower()
-
-        first_index: Optional[int] = None
-        for b in b_list:
-            lower_b = b.lower()
-            index = lower_concatenated_a.find(lower_b)
-            if (
-                index != -1
-                and (index > len(first_three_pages))
-                and (first_index is None or index < first_index)
-            ):
-                first_index = index
-
-        if first_index is not None:
-            extracted_string = concatenated_a[:first_index]
-        else:
-            extracted_string = concatenated_a
-
-        result: list[str] = []
-        current_string = ""
-        for char in extracted_string:
-            current_string += char
-            if current_string in a:
-                result.append(current_string)
-                current_string = ""
-
-        if current_string:
-            result.append(current_string)
-
+        markers = tuple(b for b in b_list if b)
+        match = (
+            _marker_pattern(markers).search("".join(a), sum(map(len, a[:3]))) if markers else None
+        )
+        # Empty strings are left out, since they contain no content
+        if match is None:
+            return [string for string in a if string]
+
+        # Locate the string containing the marker from the offsets at which the strings end,
+        # then keep the strings before it and its part before the marker
+        ends = list(itertools.accumulate(map(len, a)))
+        idx = bisect.bisect_right(ends, match.start())
+        string_start = ends[idx - 1] if idx else 0
+        result = [string for string in a[:idx] if string]
+        if match.start() > string_start:
+            result.append(a[idx][: match.start() - string_start])
         return result
 
     def extract_ending_pages(self, page_number: int = 3) -> str:
@@ -213,7 +495,7 @@ class Paper:
             >>> ending_pages = paper.extract_ending_pages(2)
         """
         ending_pages = self.extract_up_to_first_match_exclude_list(
-            self.whole_paper, self._END_MARKERS
+            self._pages_up_to_end_marker(), self._END_MARKERS
         )
         ending_pages = ending_pages[-page_number:]
         return "".join(ending_pages)
@@ -223,15 +505,48 @@ class Paper:
         Calculate the total number of tokens in the paper using the specified model.
 
         This method uses the tiktoken library to encode and count tokens according
-        to the specified model's tokenization scheme.
+        to the specified model's tokenization scheme. All pages are encoded in a single batch,
+        split between at most one thread per page and per CPU, and special tokens are counted
+        as ordinary text.
 
         Example:
             >>> paper = Paper("example.pdf")
             >>> paper.read_pymupdf()
             >>> paper.calculate_token_length()
         """
-        encoder = tiktoken.encoding_for_model(self.model)
-        self.paper_length = 0
-        for text in self.whole_paper:
-            length = len(encoder.encode(text))
-            self.paper_length += length
+        encoder = _encoder_for_model(self.model)
+        # tiktoken releases the GIL while encoding, so the pages are encoded in parallel; a thread
+        # per page at most, since each call starts its own threads
+        num_threads = max(1, min(os.cpu_count() or 1, len(self.whole_paper)))
+        self.paper_length = sum(
+            map(len, encoder.encode_ordinary_batch(self.whole_paper, num_threads=num_threads))
+        )
+
+
+def _cache_paper_text(paper_path: str, cache_folder: str) -> None:
+    """Read a PDF file with PyMuPDF and save its text to the cache folder."""
+    Paper(paper_path).read_pymupdf(cache_folder)
+
+
+def cache_paper_texts(
+    paper_paths: list[str], cache_folder: str, max_workers: Optional[int] = None
+) -> None:
+    """
+    Extract the text of several PDF files in parallel and save it to the cache folder.
+
+    Subsequent calls of ``Paper.read_pymupdf(cache_folder)`` on these files load the text from
+    the cache instead of parsing the PDF files again. The files are parsed in separate processes
+    because PyMuPDF does not support multithreading.
+
+    Args:
+        paper_paths: Paths to the PDF files.
+        cache_folder: Folder for caching the extracted text.
+        max_workers: Maximum number of worker processes. Defaults to the number of CPUs.
+
+    Example:
+        >>> cache_paper_texts(["paper1.pdf", "paper2.pdf"], "papers/.text_cache")
+    """
+    if not paper_paths:
+        return
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(_cache_paper_text, paper_paths, [cache_folder] * len(paper_paths)))
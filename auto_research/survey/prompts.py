@@ -14,9 +14,15 @@ class SurveyPrompt(PromptBase):
     conclusion, and algorithms. It also supports summarizing and explaining computer science
     papers.
 
+    Prompts built from the text of a paper start with that text, introduced by
+    ``raw_text_heading``, and end with the task-specific instructions. Prompts on the same paper
+    therefore share a byte-identical prefix, which providers with prompt caching (such as OpenAI
+    for prefixes of 1024 tokens or more) bill and process faster when it is sent again.
+
     Attributes:
         general_text_cleaning (list[str]): A list of text cleaning instructions applied across all
             prompt types.
+        raw_text_heading (str): The line introducing the raw text of a paper in prompts.
 
     Example:
         >>> prompt = SurveyPrompt()
@@ -30,6 +36,7 @@ class SurveyPrompt(PromptBase):
         "Your answer should not paraphrase or summarize the text, but should be a direct "
         "extraction of text.",
     ]
+    raw_text_heading: str = "The raw text extracted from a PDF file is:"
 
     def extract_abstract(self, raw_text: str) -> None:
         """
@@ -43,9 +50,10 @@ class SurveyPrompt(PromptBase):
             >>> prompt.extract_abstract("Paper text including abstract...")
         """
         prompt_string = [
-            "Given some raw text extracted from a PDF file, your task is to extract the abstract.",
-            "The raw text up to the first 2 pages of the PDF file is:",
+            self.raw_text_heading,
             raw_text,
+            "Given the raw text above, up to the first 2 pages of the PDF file, your task is to "
+            "extract the abstract.",
             "Your answer should be the abstract of the paper",
             *self.general_text_cleaning,
             "Here is the abstract:",
@@ -64,10 +72,10 @@ class SurveyPrompt(PromptBase):
             >>> prompt.extract_introduction("Paper text including introduction...")
         """
         prompt_string = [
-            "Given some raw text extracted from a PDF file, your task is to extract the "
-            "introduction.",
-            "The raw text up to the first 5 pages of the PDF file is:",
+            self.raw_text_heading,
             raw_text,
+            "Given the raw text above, up to the first 5 pages of the PDF file, your task is to "
+            "extract the introduction.",
             "Your answer should be the introduction of the paper",
             (
                 "Note that the paper might not have a section named 'Introduction', but the first "
@@ -95,10 +103,10 @@ class SurveyPrompt(PromptBase):
             >>> prompt.extract_discussion("Paper text including discussion...")
         """
         prompt_string = [
-            "Given some raw text extracted from a PDF file, your task is to extract the "
-            "discussion.",
-            "The raw text of the last 3 pages of the PDF file is:",
+            self.raw_text_heading,
             raw_text,
+            "Given the raw text above, of the last 3 pages of the PDF file, your task is to "
+            "extract the discussion.",
             "Your answer should be the discussion of the paper",
             (
                 "Note that the paper might not have a section named 'Discussion', but the last "
@@ -130,10 +138,10 @@ class SurveyPrompt(PromptBase):
             >>> prompt.extract_conclusion("Paper text including conclusion...")
         """
         prompt_string = [
-            "Given some raw text extracted from a PDF file, your task is to extract the "
-            "conclusion.",
-            "The raw text of the last 3 pages of the PDF file is:",
+            self.raw_text_heading,
             raw_text,
+            "Given the raw text above, of the last 3 pages of the PDF file, your task is to "
+            "extract the conclusion.",
             "Your answer should be the conclusion of the paper",
             (
                 "Note that the paper might not have a section named 'Conclusion', but the last "
@@ -153,6 +161,66 @@ class SurveyPrompt(PromptBase):
         ]
         self.prompt = self.list_to_formatted_OpenAI(prompt_string)
 
+    def extract_key_information(self, head_text: str, ending_text: Optional[str]) -> None:
+        """
+        Generate a prompt for extracting the abstract, introduction, discussion, and conclusion
+        from raw text at once.
+
+        The answer is expected to be a JSON object with the keys "abstract", "introduction",
+        "discussion", and "conclusion".
+
+        Args:
+            head_text (str): The raw text extracted from the first 5 pages of a PDF file.
+            ending_text (Optional[str]): The raw text extracted from the last 3 pages of a PDF
+                file. If None or empty, only the abstract and the introduction are extracted.
+
+        Example:
+            >>> prompt = SurveyPrompt()
+            >>> prompt.extract_key_information("Paper text...", "Ending pages text...")
+        """
+        prompt_string = [
+            self.raw_text_heading,
+            head_text,
+        ]
+        if ending_text:
+            prompt_string += [
+                "The raw text of the last 3 pages of the PDF file is:",
+                ending_text,
+            ]
+        prompt_string += [
+            "Given the raw text above, up to the first 5 pages of the PDF file"
+            + (" and of its last 3 pages" if ending_text else "")
+            + ", your task is to extract the abstract, introduction, discussion, and conclusion.",
+            (
+                "The abstract and the introduction should be extracted from the first pages. "
+                "Note that the paper might not have a section named 'Introduction', but the "
+                "first few pages usually contain the equivalent, such as a section named "
+                "'Background' or 'Related Work'. If the paper has more than one section related "
+                "to the introduction, you should only include the first one."
+            ),
+            (
+                "The discussion and the conclusion should be extracted from the last pages. "
+                "Note that the paper might not have sections named 'Discussion' or "
+                "'Conclusion', but the last few pages usually contain the equivalent, such as "
+                "sections named 'Analysis', 'Limitations', 'Future Work', 'Summary', or "
+                "'Concluding Remarks'. If the paper has more than one section related to the "
+                "discussion, you should only include the first one. If the paper has more than "
+                "one section related to the conclusion, you should only include the last one."
+            ),
+            (
+                "If a section does not exist, or you cannot identify it from the provided text, "
+                "its value is simply 'N/A'."
+            ),
+            *self.general_text_cleaning,
+            (
+                'Your answer should be a JSON object with exactly the keys "abstract", '
+                '"introduction", "discussion", and "conclusion", whose values are the '
+                "extracted text of the corresponding sections, and nothing else."
+            ),
+            "Here is the JSON object:",
+        ]
+        self.prompt = self.list_to_formatted_OpenAI(prompt_string)
+
     def extract_algorithm(self, raw_text: str) -> None:
         """
         Generate a prompt for extracting algorithms from raw text.
@@ -165,10 +233,10 @@ class SurveyPrompt(PromptBase):
             >>> prompt.extract_algorithm("Paper text including algorithms...")
         """
         prompt_string = [
-            "Given some raw text extracted from a PDF file, your task is to extract the "
-            "algorithm.",
-            "The raw text up to the first 12 pages of the PDF file is:",
+            self.raw_text_heading,
             raw_text,
+            "Given the raw text above, up to the first 12 pages of the PDF file, your task is to "
+            "extract the algorithm.",
             "Your answer should be a Python list of strings that describe the algorithm in "
             "pseudo-code format.",
             (
@@ -193,12 +261,12 @@ class SurveyPrompt(PromptBase):
             >>> prompt.explain_algorithm("Paper text...", "Algorithm description...")
         """
         prompt_string = [
-            "Given the algorithm described in a paper, your task is to explain the algorithm "
-            "by reading the first 12 pages of the paper.",
-            "The first 12 pages of the paper is:",
+            self.raw_text_heading,
             paper,
-            "The algorithm is:",
+            "The algorithm described in the paper is:",
             algorithm,
+            "Given the raw text above, up to the first 12 pages of the paper, your task is to "
+            "explain the algorithm.",
             "Your answer should include the following information:",
             "1. Meaning of each variable/part of the algorithm",
             "2. Explanation of any terms/concepts/operations that are beyond the common "
@@ -356,12 +424,55 @@ class SurveyPrompt(PromptBase):
             >>> prompt.information_retrieval("Raw text...", "Designated information...")
         """
         prompt_string = [
-            "Given the raw extracted text from the PDF file of a research article, your "
-            "task is to retrieve the information designated by the user. The raw extracted text "
-            "is:",
+            self.raw_text_heading,
             raw_extracted_text,
+            "Given the raw text above, extracted from the PDF file of a research article, your "
+            "task is to retrieve the information designated by the user.",
             "The user's designated information is:",
             designated_information,
             "Here is the retrieved information:",
         ]
         self.prompt = self.list_to_formatted_OpenAI(prompt_string)
+
+    def information_retrieval_batch(
+        self, raw_extracted_texts: list[str], designated_information: str
+    ) -> None:
+        """
+        Generate a prompt to retrieve the same information from several articles at once.
+
+        The answer for the i-th article is expected on its own line, prefixed by the marker
+        ``<<<i>>>`` (articles are numbered from 1).
+
+        Args:
+            raw_extracted_texts (list[str]): The raw texts extracted from the PDF files, one per
+                article.
+            designated_information (str): The specific information the user wants to retrieve
+                from each article.
+
+        Example:
+            >>> prompt = SurveyPrompt()
+            >>> prompt.information_retrieval_batch(
+            ...     ["Raw text 1...", "Raw text 2..."], "Designated information..."
+            ... )
+        """
+        number_of_articles = len(raw_extracted_texts)
+        prompt_string = [
+            f"Given the raw extracted text from the PDF files of {number_of_articles} research "
+            "articles, your task is to retrieve the information designated by the user from "
+            "each article separately.",
+            "The user's designated information is:",
+            designated_information,
+        ]
+        for idx, raw_extracted_text in enumerate(raw_extracted_texts, start=1):
+            prompt_string += [
+                f"-----Article {idx} beginning marker-----\n{raw_extracted_text}\n"
+                f"-----Article {idx} ending marker-----"
+            ]
+        prompt_string += [
+            f"Your answer should have exactly {number_of_articles} lines, one line for each "
+            "article in the given order. Each line should start with <<<i>>>, where i is the "
+            "number of the article, immediately followed by the retrieved information for that "
+            "article and nothing else. For example, the first line should start with <<<1>>>.",
+            "Here is the retrieved information:",
+        ]
+        self.prompt = self.list_to_formatted_OpenAI(prompt_string)
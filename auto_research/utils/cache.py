@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from contextlib import closing
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+from typing import Optional
+
+
+class ResponseCache:
+    """
+    A persistent key-value cache for expensive responses, backed by a single SQLite file.
+
+    Values are stored as JSON, so anything that can be serialized by ``json`` can be cached.
+    Every operation opens its own short-lived connection, which keeps the cache safe to share
+    between threads and between processes working on the same file.
+
+    Args:
+        path (str): Path to the SQLite file. Missing parent folders are created.
+        ttl (Optional[float]): Number of seconds after which an entry expires. If None, entries
+            never expire. Defaults to 86400 (one day).
+
+    Attributes:
+        hits (int): Number of calls of :meth:`get` that returned a cached value.
+        misses (int): Number of calls of :meth:`get` that found no valid entry.
+
+    Example:
+        >>> cache = ResponseCache("papers/llm_cache.sqlite")
+        >>> key = ResponseCache.make_key("gpt-4o-mini", "Summarize the paper ...")
+        >>> cache.put(key, "The summary is ...")
+        >>> cache.get(key)
+        'The summary is ...'
+    """
+
+    def __init__(self, path: str, ttl: Optional[float] = 86400) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._counter_lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(sqlite3.connect(self.path)) as connection, connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+            )
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """
+        Build a deterministic cache key from the given parts.
+
+        Args:
+            *parts (str): The strings that identify an entry, e.g. the model name and the prompt.
+
+        Returns:
+            str: The SHA-256 hex digest of the parts.
+
+        Example:
+            >>> len(ResponseCache.make_key("gpt-4o-mini", "prompt"))
+            64
+        """
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """
+        Retrieve a cached value.
+
+        Args:
+            key (str): The key of the entry.
+            max_age (Optional[float]): Number of seconds after which this entry is considered
+                expired, if shorter than the TTL of the cache, e.g. for entries that should be
+                refreshed more often than the others. Defaults to None.
+
+        Returns:
+            Optional[Any]: The cached value, or None if the key is missing or the entry has
+            expired.
+        """
+        with closing(sqlite3.connect(self.path)) as connection:
+            row = connection.execute(
+                "SELECT value, created FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is not None:
+            value, created = row
+            age = time.time() - created
+            if (self.ttl is not None and age > self.ttl) or (
+                max_age is not None and age > max_age
+            ):
+                row = None
+        with self._counter_lock:
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return json.loads(value) if row is not None else None
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Store a value, replacing any existing entry with the same key.
+
+        Args:
+            key (str): The key of the entry.
+            value (Any): A JSON-serializable value.
+        """
+        with closing(sqlite3.connect(self.path)) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO cache (key, value, created) VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time()),
+            )
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import threading
+import time
+from types import TracebackType
+from typing import Optional
+
+
+class RateLimiter:
+    """
+    A thread-safe rate limiter that spaces out the start of consecutive calls.
+
+    Each call to :meth:`acquire` (or each entry of the limiter as a context manager) blocks until
+    at least ``interval`` seconds have passed since the previous call was allowed to start. Calls
+    guarded by different limiters, e.g. requests to different hosts, do not wait for each other.
+
+    Args:
+        interval (float): Minimum number of seconds between the start of two calls.
+
+    Example:
+        >>> limiter = RateLimiter(1.0)
+        >>> with limiter:
+        ...     response = requests.get("https://api.semanticscholar.org/graph/v1/paper/search")
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def acquire(self) -> None:
+        """Block until the next call is allowed to start."""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+    def __enter__(self) -> RateLimiter:
+        self.acquire()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        pass
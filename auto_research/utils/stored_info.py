@@ -1,12 +1,37 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 import os
+import threading
+from typing import Iterator
 from typing import Optional
 from typing import Union
 
 from LLM_utils.storage import Storage_base
 
 
+# One lock per storage file, so that concurrent writers do not overwrite each other's updates
+_FILE_LOCKS: dict[str, threading.Lock] = {}
+_FILE_LOCKS_GUARD = threading.Lock()
+
+
+def _get_file_lock(path: str) -> threading.Lock:
+    """
+    Return the lock guarding the storage file at the given path.
+
+    Args:
+        path (str): The path to the storage file.
+
+    Returns:
+        threading.Lock: The lock shared by all Storage instances using this file.
+    """
+    key = os.path.abspath(path)
+    with _FILE_LOCKS_GUARD:
+        if key not in _FILE_LOCKS:
+            _FILE_LOCKS[key] = threading.Lock()
+        return _FILE_LOCKS[key]
+
+
 class Storage(Storage_base):
     """
     A class for managing and storing information about papers in a structured format.
@@ -30,6 +55,59 @@ class Storage(Storage_base):
         This is a summary.
     """
 
+    def __init__(self, path: str, debug: bool = False) -> None:
+        super().__init__(path, debug=debug)
+        # Modification time, size and inode of the storage file when it was last loaded or saved
+        self._loaded_signature: Optional[tuple[int, int, int]] = None
+        # Updates added inside `deferred_saves` and not written to the storage file yet
+        self._pending_updates: list[tuple[str, str, str, Optional[int]]] = []
+        self._deferring_saves = False
+
+    def load_info(self) -> None:
+        """
+        Load the information from the storage file.
+
+        The file is only read and parsed if it has changed since this instance last loaded or
+        saved it, which is detected from its modification time, size and inode. Updates deferred
+        by `deferred_saves` are applied again on top of the reloaded information. If the file
+        does not exist, the information in memory is kept as is.
+
+        Returns:
+            None
+
+        Example:
+            >>> storage = Storage("storage.json")
+            >>> storage.load_info()
+        """
+        signature = self._file_signature()
+        if signature is not None and signature != self._loaded_signature:
+            super().load_info()
+            self._loaded_signature = signature
+            for update in self._pending_updates:
+                self._set_info(*update)
+
+    def save_info(self) -> None:
+        """
+        Save the information to the storage file.
+
+        Returns:
+            None
+
+        Example:
+            >>> storage = Storage("storage.json")
+            >>> storage.add_papers_by_name(["paper1.pdf"])
+            >>> storage.save_info()
+        """
+        super().save_info()
+        self._loaded_signature = self._file_signature()
+
+    def _file_signature(self) -> Optional[tuple[int, int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
     def add_papers_by_path(self, path_to_paper: str) -> None:
         """
         Add the file names of all papers in a specified directory as keys to the info dictionary.
@@ -72,7 +150,9 @@ class Storage(Storage_base):
         Add information to a specific paper in the info dictionary.
 
         If the paper or info type does not exist, they are initialized. If a trial number
-        is not provided, the next available trial number is automatically assigned.
+        is not provided, the next available trial number is automatically assigned. The
+        read-modify-write of the storage file is serialized across threads. Inside
+        `deferred_saves`, the file is only written when the updates are flushed.
 
         Args:
             paper_name (str): The name of the paper to which information will be added.
@@ -93,8 +173,17 @@ class Storage(Storage_base):
             >>> storage.add_papers_by_name(["paper1.pdf"])
             >>> storage.add_info_to_a_paper("paper1.pdf", "summary", "This is a summary.")
         """
-        self.load_info()
-
+        with _get_file_lock(self.path):
+            self.load_info()
+            self._set_info(paper_name, info_type, info_content, info_trial)
+            if self._deferring_saves:
+                self._pending_updates.append((paper_name, info_type, info_content, info_trial))
+            else:
+                self.save_info()
+
+    def _set_info(
+        self, paper_name: str, info_type: str, info_content: str, info_trial: Optional[int]
+    ) -> None:
         if paper_name not in self.information:
             self.information[paper_name] = {}
 
@@ -103,7 +192,8 @@ class Storage(Storage_base):
 
         if info_trial in self.information[paper_name][info_type]:
             raise ValueError(
-                f"This trial already exists for the paper {paper_name} and info type {info_type}."
+                f"This trial already exists for the paper {paper_name} and info type "
+                f"{info_type}."
             )
 
         if info_trial is None:
@@ -111,7 +201,55 @@ class Storage(Storage_base):
             info_trial = max(existing_trials) + 1 if existing_trials else 1
 
         self.information[paper_name][info_type][str(info_trial)] = info_content
-        self.save_info()
+
+    @contextmanager
+    def deferred_saves(self) -> Iterator[None]:
+        """
+        Keep the information added to papers in memory and write the storage file once at the end.
+
+        Each call to `add_info_to_a_paper` otherwise rewrites the whole storage file. The pending
+        updates are flushed when the context exits, even if it exits with an exception.
+
+        Example:
+            >>> storage = Storage("storage.json")
+            >>> with storage.deferred_saves():
+            ...     storage.add_info_to_a_paper("paper1.pdf", "abstract", "An abstract.")
+            ...     storage.add_info_to_a_paper("paper1.pdf", "summary", "A summary.")
+        """
+        if self._deferring_saves:
+            yield
+            return
+
+        self._deferring_saves = True
+        self._pending_updates = []
+        try:
+            yield
+        finally:
+            self._deferring_saves = False
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write the updates deferred by `deferred_saves` to the storage file.
+
+        If the file was modified by another writer in the meantime, it is reloaded first, so
+        that the updates of the other writer are kept.
+
+        Returns:
+            None
+
+        Example:
+            >>> storage = Storage("storage.json")
+            >>> storage.flush()
+        """
+        if not self._pending_updates:
+            return
+
+        with _get_file_lock(self.path):
+            if self._file_signature() is not None:
+                self.load_info()
+            self.save_info()
+        self._pending_updates = []
 
     def get_info(
         self,